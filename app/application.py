@@ -89,6 +89,8 @@ class WebAppsApplication(Adw.Application):
 
     def _init_components(self) -> None:
         """Initialize core application components."""
+        XDGDirectories.ensure_dirs()
+
         # Initialize database
         db_path = XDGDirectories.get_database_path()
         self.database = Database(db_path)
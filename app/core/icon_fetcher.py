@@ -260,7 +260,7 @@ class IconFetcher:
 
         # Save as PNG
         icon_path = XDGDirectories.get_icon_path(webapp_id, "png")
-        image.save(icon_path, "PNG", optimize=True)
+        image.save(icon_path, "PNG", optimize=False, compress_level=6)
 
         logger.debug(f"Icon processed and saved: {icon_path}")
         return icon_path
@@ -5,7 +5,9 @@ handling CRUD operations, lifecycle, and coordination between
 database, profiles, and UI.
 """
 
+from dataclasses import fields, replace
 from datetime import datetime
+import fcntl
 import os
 import signal
 from typing import List, Optional
@@ -20,6 +22,11 @@ from .desktop_integration import DesktopIntegration
 
 logger = get_logger(__name__)
 
+# WebAppSettings fields that update_webapp_settings accepts as overrides
+_SETTINGS_OVERRIDES = frozenset(
+    field.name for field in fields(WebAppSettings) if field.name != "webapp_id"
+)
+
 
 class WebAppManager:
     """Manages webapp lifecycle and operations.
@@ -205,11 +212,10 @@ class WebAppManager:
 
         # Remove PID tracking file if left behind
         pid_file = XDGDirectories.get_webapp_pid_file(webapp_id)
-        if pid_file.exists():
-            try:
-                pid_file.unlink()
-            except OSError as exc:
-                logger.debug("Não foi possível remover arquivo PID: %s", exc)
+        try:
+            pid_file.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug("Não foi possível remover arquivo PID: %s", exc)
 
         # Remove desktop integrations (launcher, desktop shortcut, system icon)
         DesktopIntegration.delete_desktop_file(webapp_id)
@@ -227,15 +233,27 @@ class WebAppManager:
         """
         return self.db.get_webapp_settings(webapp_id)
 
-    def update_webapp_settings(self, settings: WebAppSettings) -> None:
+    def update_webapp_settings(self, settings: WebAppSettings, **overrides: object) -> None:
         """Update webapp settings.
 
         Args:
             settings: Updated settings
+            **overrides: Setting fields to change before persisting
 
         Raises:
-            ValueError: If validation fails
+            ValueError: If an override is not a setting field or the
+                resulting settings fail validation
         """
+        if overrides:
+            for field_name in overrides:
+                if field_name not in _SETTINGS_OVERRIDES:
+                    raise ValueError(f"Invalid setting: {field_name}")
+            # Work on a copy so invalid values never reach the caller's object
+            settings = replace(settings)
+            for field_name, value in overrides.items():
+                setattr(settings, field_name, value)
+            settings.__post_init__()
+
         logger.debug(f"Updating settings for webapp: {settings.webapp_id}")
         self.db.update_webapp_settings(settings)
 
@@ -245,37 +263,58 @@ class WebAppManager:
                 settings.webapp_id, settings
             )
 
-    def close_running_webapp(self, webapp_id: str) -> bool:
-        """Attempt to close a running standalone webapp via its PID file."""
+    def _read_running_pid(self, webapp_id: str) -> Optional[int]:
+        """Return the PID of a running standalone webapp, if any.
+
+        Standalone processes hold an exclusive ``flock`` on their PID file for
+        their whole lifetime. If the lock can be taken here, the owner is gone
+        and the file is stale.
+        """
         pid_file = XDGDirectories.get_webapp_pid_file(webapp_id)
-        if not pid_file.exists():
+        try:
+            fd = os.open(pid_file, os.O_RDONLY)
+        except FileNotFoundError:
             logger.debug("PID file not found for webapp %s", webapp_id)
-            return False
+            return None
+        except OSError as exc:
+            logger.warning("Failed to open PID file for %s: %s", webapp_id, exc)
+            return None
 
         try:
-            pid_str = pid_file.read_text(encoding="utf-8").strip()
-            pid = int(pid_str)
-        except Exception as exc:
-            logger.warning("Failed to read PID file for %s: %s", webapp_id, exc)
             try:
-                pid_file.unlink()
-            except OSError:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
                 pass
+            else:
+                # Left in place: unlinking could race a new instance that has
+                # created the file but not locked it yet. The writer truncates it.
+                logger.debug("Stale PID file for webapp %s", webapp_id)
+                return None
+
+            content = os.read(fd, 32).decode("utf-8").strip()
+            if not content:
+                # Locked but not written yet: the instance is still starting
+                logger.debug("Webapp %s is still starting", webapp_id)
+                return None
+            try:
+                return int(content)
+            except ValueError as exc:
+                logger.warning("Failed to read PID file for %s: %s", webapp_id, exc)
+                return None
+        finally:
+            os.close(fd)
+
+    def close_running_webapp(self, webapp_id: str) -> bool:
+        """Attempt to close a running standalone webapp via its PID file."""
+        pid = self._read_running_pid(webapp_id)
+        if pid is None:
             return False
 
         try:
             os.kill(pid, signal.SIGTERM)
             logger.info("Sent SIGTERM to webapp %s (PID %d)", webapp_id, pid)
-            try:
-                pid_file.unlink()
-            except OSError:
-                pass
         except ProcessLookupError:
             logger.debug("Process for webapp %s already stopped", webapp_id)
-            try:
-                pid_file.unlink()
-            except OSError:
-                pass
             return False
         except PermissionError as exc:
             logger.warning("Permission denied sending SIGTERM to %s: %s", webapp_id, exc)
@@ -288,14 +327,8 @@ class WebAppManager:
 
     def refresh_running_webapp(self, webapp_id: str) -> bool:
         """Signal a running webapp to refresh its branding (icon/name)."""
-        pid_file = XDGDirectories.get_webapp_pid_file(webapp_id)
-        if not pid_file.exists():
-            return False
-
-        try:
-            pid = int(pid_file.read_text(encoding="utf-8").strip())
-        except Exception as exc:
-            logger.warning("Failed to read PID file for refresh %s: %s", webapp_id, exc)
+        pid = self._read_running_pid(webapp_id)
+        if pid is None:
             return False
 
         try:
@@ -13,6 +13,17 @@ from typing import Generator, Optional
 
 from .models import AppSettings, WebApp, WebAppSettings
 
+# Per-connection tuning: memory-map the database file (256 MB) so cold reads
+# are served by page faults instead of read() syscalls, keep an 8 MB page
+# cache and temporary tables in memory. Every process opening the database
+# (main window and standalone webapps) goes through _get_connection, so all
+# readers and writers share the same settings.
+_CONNECTION_PRAGMAS = """
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -8000;
+    PRAGMA temp_store = MEMORY;
+"""
+
 
 class DatabaseError(Exception):
     """Base exception for database operations."""
@@ -55,6 +66,7 @@ class Database:
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
+            conn.executescript(_CONNECTION_PRAGMAS)
             # Enable foreign keys
             conn.execute("PRAGMA foreign_keys = ON")
             yield conn
@@ -50,7 +50,7 @@ class WebApp:
         Returns:
             True if icon_path is set, False otherwise
         """
-        return self.icon_path is not None and len(self.icon_path) > 0
+        return bool(self.icon_path)
 
 
 @dataclass
@@ -91,9 +91,10 @@ class WebAppSettings:
 
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
-        if self.zoom_level <= 0:
-            raise ValueError("Zoom level must be positive")
-        if self.window_width <= 0 or self.window_height <= 0:
+        if self.zoom_level <= 0 or self.window_width <= 0 or self.window_height <= 0:
+            # Slow path: only work out the specific message on failure
+            if self.zoom_level <= 0:
+                raise ValueError("Zoom level must be positive")
             raise ValueError("Window dimensions must be positive")
 
 
@@ -113,18 +114,25 @@ class AppSettings:
     shared_network_process: bool = True
     language: str = "pt"
 
-    VALID_THEMES = {"default", "dark", "light"}
-    VALID_STARTUP_BEHAVIORS = {"main_window", "hidden", "restore_session"}
-    VALID_LANGUAGES = {"pt", "en"}
+    VALID_THEMES = frozenset({"default", "dark", "light"})
+    VALID_STARTUP_BEHAVIORS = frozenset({"main_window", "hidden", "restore_session"})
+    VALID_LANGUAGES = frozenset({"pt", "en"})
 
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
+        if (
+            self.theme in self.VALID_THEMES
+            and self.startup_behavior in self.VALID_STARTUP_BEHAVIORS
+            and self.language in self.VALID_LANGUAGES
+        ):
+            return
+
+        # Slow path: only work out the specific message on failure
         if self.theme not in self.VALID_THEMES:
             raise ValueError(f"Invalid theme: {self.theme}")
         if self.startup_behavior not in self.VALID_STARTUP_BEHAVIORS:
             raise ValueError(f"Invalid startup behavior: {self.startup_behavior}")
-        if self.language not in self.VALID_LANGUAGES:
-            raise ValueError(f"Invalid language: {self.language}")
+        raise ValueError(f"Invalid language: {self.language}")
 
 
 @dataclass
@@ -141,7 +149,7 @@ class WebAppSession:
 
     webapp_id: str
     active_tab_index: int = 0
-    tabs: list[str] = field(default_factory=lambda: [])
+    tabs: list[str] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         """Validate session after initialization."""
@@ -155,7 +163,7 @@ class WebAppSession:
         Returns:
             True if there are tabs, False otherwise
         """
-        return len(self.tabs) > 0
+        return bool(self.tabs)
 
 
 @dataclass(frozen=True)
@@ -184,3 +192,18 @@ DEFAULT_CATEGORIES: list[WebAppCategory] = [
     WebAppCategory("finance", "Finance", "emblem-money-symbolic"),
     WebAppCategory("other", "Other", "applications-other-symbolic"),
 ]
+
+# Category lookup by id (instances are frozen and safe to share)
+CATEGORIES_BY_ID: dict[str, WebAppCategory] = {c.id: c for c in DEFAULT_CATEGORIES}
+
+
+def get_category(category_id: Optional[str]) -> Optional[WebAppCategory]:
+    """Get a predefined category by its id.
+
+    Args:
+        category_id: Category identifier (e.g., 'social')
+
+    Returns:
+        Matching WebAppCategory or None if unknown
+    """
+    return CATEGORIES_BY_ID.get(category_id) if category_id else None
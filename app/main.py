@@ -4,6 +4,7 @@ This module provides the main() function that initializes and runs
 the GTK application.
 """
 
+import os
 import sys
 
 import gi
@@ -13,8 +14,6 @@ gi.require_version("Gdk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("WebKit", "6.0")
 
-from gi.repository import Gdk, Gtk
-
 from .application import WebAppsApplication
 from .utils.logger import Logger, get_logger
 
@@ -36,29 +35,19 @@ def main() -> int:
 
         logger.info("Starting Super WebApp...")
 
-        # Ensure a graphical session is available before registering the app
-        init_result = Gtk.init_check()
-        if isinstance(init_result, tuple):
-            initialized, error = init_result
-        else:
-            initialized = bool(init_result)
-            error = None
-
-        display = Gdk.Display.get_default() if initialized else None
-
-        if not initialized or display is None:
+        # Ensure a graphical session is available before registering the app.
+        # GTK4 initializes itself inside app.run(), so only check the environment.
+        if not (os.environ.get("WAYLAND_DISPLAY") or os.environ.get("DISPLAY")):
             logger.error(
                 "Não foi possível inicializar o GTK. Execute dentro de uma sessão gráfica (Wayland/X11)."
             )
-            if error:
-                logger.error("Detalhes: %s", error.message)
             return 1
 
         # Create and run application
         app = WebAppsApplication()
         exit_code = app.run(sys.argv)
 
-        logger.info(f"Application exited with code: {exit_code}")
+        logger.info("Application exited with code: %s", exit_code)
         return exit_code
 
     except KeyboardInterrupt:
@@ -66,7 +55,7 @@ def main() -> int:
         return 130
 
     except Exception as e:
-        logger.critical(f"Unhandled exception: {e}", exc_info=True)
+        logger.critical("Unhandled exception: %s", e, exc_info=True)
         return 1
 
 
@@ -5,10 +5,10 @@ completely independent from the main application.
 """
 
 import sys
-import atexit
+import fcntl
 import os
 import signal
-from pathlib import Path
+import time
 from typing import Optional
 
 import gi
@@ -29,6 +29,10 @@ from .webengine.profile_manager import ProfileManager
 
 logger = get_logger(__name__)
 
+# Lock attempts (and delay between them, in seconds) before giving up on the PID file
+_PID_LOCK_ATTEMPTS = 10
+_PID_LOCK_RETRY_DELAY = 0.02
+
 
 class StandaloneWebAppApplication(Adw.Application):
     """Standalone application for a single webapp."""
@@ -49,19 +53,25 @@ class StandaloneWebAppApplication(Adw.Application):
         self.profile_manager = None
         self.notification_manager = None
         self.webapp_window = None
+        # Descriptor holding the PID file lock; kept open for the process lifetime
+        self.pid_fd: Optional[int] = None
 
-        logger.info(f"StandaloneWebAppApplication initialized for {webapp_id} (ID: {unique_app_id})")
+        logger.info(
+            "StandaloneWebAppApplication initialized for %s (ID: %s)", webapp_id, unique_app_id
+        )
 
     def do_startup(self) -> None:
         """Application startup - initialize components."""
         Adw.Application.do_startup(self)
 
-        logger.info(f"Starting standalone webapp: {self.webapp_id}")
+        logger.info("Starting standalone webapp: %s", self.webapp_id)
+
+        XDGDirectories.ensure_dirs()
 
         # Initialize database
         db_path = XDGDirectories.get_database_path()
         self.database = Database(db_path)
-        logger.debug(f"Database initialized: {db_path}")
+        logger.debug("Database initialized: %s", db_path)
 
         # Initialize profile manager
         self.profile_manager = ProfileManager()
@@ -78,18 +88,18 @@ class StandaloneWebAppApplication(Adw.Application):
 
     def do_activate(self) -> None:
         """Application activation - create and show webapp window."""
-        logger.info(f"Activating standalone webapp: {self.webapp_id}")
+        logger.info("Activating standalone webapp: %s", self.webapp_id)
 
         # Get webapp data
         webapp = self.webapp_manager.get_webapp(self.webapp_id)
         if not webapp:
-            logger.error(f"WebApp not found: {self.webapp_id}")
+            logger.error("WebApp not found: %s", self.webapp_id)
             self.quit()
             return
 
         settings = self.webapp_manager.get_webapp_settings(self.webapp_id)
         if not settings:
-            logger.error(f"Settings not found for webapp: {self.webapp_id}")
+            logger.error("Settings not found for webapp: %s", self.webapp_id)
             self.quit()
             return
 
@@ -108,7 +118,7 @@ class StandaloneWebAppApplication(Adw.Application):
         )
 
         self.webapp_window.present()
-        logger.info(f"Standalone webapp window created for {webapp.name}")
+        logger.info("Standalone webapp window created for %s", webapp.name)
 
     def _on_window_closed(self, webapp_id: str) -> None:
         """Handle webapp window closed.
@@ -116,7 +126,7 @@ class StandaloneWebAppApplication(Adw.Application):
         Args:
             webapp_id: ID of the webapp that was closed
         """
-        logger.info(f"Standalone webapp window closed: {webapp_id}")
+        logger.info("Standalone webapp window closed: %s", webapp_id)
         # Quit the application when window is closed
         self.quit()
 
@@ -137,7 +147,7 @@ class StandaloneWebAppApplication(Adw.Application):
 
     def do_shutdown(self) -> None:
         """Application shutdown - cleanup."""
-        logger.info(f"Shutting down standalone webapp: {self.webapp_id}")
+        logger.info("Shutting down standalone webapp: %s", self.webapp_id)
 
         if self.database:
             self.database.close()
@@ -147,6 +157,43 @@ class StandaloneWebAppApplication(Adw.Application):
         logger.info("Standalone webapp shutdown complete")
 
 
+def _acquire_pid_lock(webapp_id: str) -> int:
+    """Write the current PID to the webapp PID file and hold an exclusive lock.
+
+    The kernel drops the lock when the process dies, so readers can tell a
+    live instance from a stale file without relying on exit handlers.
+
+    Args:
+        webapp_id: ID of the webapp being launched
+
+    Returns:
+        File descriptor that must stay open while the webapp runs
+
+    Raises:
+        OSError: If the file cannot be opened or is locked by another process
+    """
+    pid_file = XDGDirectories.get_webapp_pid_file(webapp_id)
+    fd = os.open(pid_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        # Readers probe liveness by taking the lock for an instant; retry briefly
+        # so such a probe is not mistaken for another running instance
+        for attempt in range(_PID_LOCK_ATTEMPTS):
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if attempt == _PID_LOCK_ATTEMPTS - 1:
+                    raise
+                time.sleep(_PID_LOCK_RETRY_DELAY)
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("utf-8"))
+    except OSError:
+        os.close(fd)
+        raise
+    logger.debug("PID registrado em %s", pid_file)
+    return fd
+
+
 def main_standalone(webapp_id: str, debug: bool = False) -> int:
     """Main entry point for standalone webapp.
 
@@ -165,23 +212,11 @@ def main_standalone(webapp_id: str, debug: bool = False) -> int:
         # Create and run standalone app
         app = StandaloneWebAppApplication(webapp_id)
 
-        pid_file: Optional[Path] = None
         try:
-            pid_file = XDGDirectories.get_webapp_pid_file(webapp_id)
-            pid_file.write_text(str(os.getpid()), encoding="utf-8")
-            logger.debug("PID registrado em %s", pid_file)
+            app.pid_fd = _acquire_pid_lock(webapp_id)
         except Exception as exc:
             logger.warning("Não foi possível registrar PID do webapp: %s", exc)
 
-        def cleanup_pid() -> None:
-            if pid_file and pid_file.exists():
-                try:
-                    pid_file.unlink()
-                except OSError as remove_exc:
-                    logger.debug("Falha ao remover arquivo PID: %s", remove_exc)
-
-        atexit.register(cleanup_pid)
-
         def _handle_exit_signal(signum, _frame) -> None:
             logger.info("Sinal %s recebido; encerrando webapp %s", signum, webapp_id)
             app.quit()
@@ -203,11 +238,11 @@ def main_standalone(webapp_id: str, debug: bool = False) -> int:
 
         exit_code = app.run([])
 
-        logger.info(f"Standalone webapp exited with code: {exit_code}")
+        logger.info("Standalone webapp exited with code: %s", exit_code)
         return exit_code
 
     except Exception as e:
-        logger.critical(f"Unhandled exception in standalone webapp: {e}", exc_info=True)
+        logger.critical("Unhandled exception in standalone webapp: %s", e, exc_info=True)
         return 1
 
 
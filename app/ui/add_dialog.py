@@ -4,40 +4,233 @@ This module provides a dialog for creating new webapps or editing
 existing ones with all configuration options.
 """
 
-from typing import Optional
-import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+import hashlib
+import re
+import time
 import uuid
 from urllib.parse import urlparse
 from pathlib import Path
-import shutil
-
-from PIL import Image
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, GLib, Gtk
+gi.require_version("GdkPixbuf", "2.0")
+from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk
 
-from ..core.desktop_integration import DesktopIntegration
-from ..core.icon_fetcher import IconFetcher
 from ..core.webapp_manager import WebAppManager
 from ..data.models import DEFAULT_CATEGORIES, WebApp
 from ..utils.i18n import (
     gettext as _,
     get_category_label,
+    get_language,
     subscribe as i18n_subscribe,
     unsubscribe as i18n_unsubscribe,
 )
 from ..utils.logger import get_logger
 from ..utils.xdg import XDGDirectories
 
+if TYPE_CHECKING:
+    from ..core.icon_fetcher import IconFetcher
+
 logger = get_logger(__name__)
 
+# Shared worker pool for icon/title fetches (keeps network I/O off the UI thread)
+_ICON_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="icon-fetch")
+# Separate single worker for CPU-bound Pillow work, so saves never queue behind slow fetches
+_ICON_RESIZE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="icon-resize")
+
+# Bounds of each dialog's cache of fetch results
+_ICON_CACHE_MAX_ENTRIES = 32
+_ICON_CACHE_TTL = 600.0  # seconds
+
+# Runs of whitespace collapsed to a single space in detected page titles
+_WS_RE = re.compile(r"\s+")
+
+# Quiet period after the last URL keystroke before fetching icon/title
+_URL_FETCH_DELAY_MS = 1500
+
+# Category id <-> ComboRow position, built once from DEFAULT_CATEGORIES
+_CATEGORY_INDEX = {cat.id: i for i, cat in enumerate(DEFAULT_CATEGORIES)}
+_CATEGORY_IDS = tuple(cat.id for cat in DEFAULT_CATEGORIES)
+
+# (widget attribute, setter, translation key) triples applied by _apply_static_translations
+_APPLY = (
+    ("cancel_button", "set_label", "dialog.cancel"),
+    ("basic_group", "set_title", "dialog.group.basic"),
+    ("name_entry", "set_title", "dialog.field.name"),
+    ("url_entry", "set_title", "dialog.field.url"),
+    ("category_row", "set_title", "dialog.field.category"),
+    ("icon_group", "set_title", "dialog.group.icon"),
+    ("icon_button_row", "set_title", "dialog.icon.fetch_auto"),
+    ("nav_group", "set_title", "dialog.group.navigation"),
+    ("tabs_switch", "set_title", "dialog.navigation.allow_tabs"),
+    ("tabs_switch", "set_subtitle", "dialog.navigation.allow_tabs_desc"),
+    ("popups_switch", "set_title", "dialog.navigation.allow_popups"),
+    ("popups_switch", "set_subtitle", "dialog.navigation.allow_popups_desc"),
+    ("system_group", "set_title", "dialog.group.system"),
+    ("notif_switch", "set_title", "dialog.system.allow_notifications"),
+    ("notif_switch", "set_subtitle", "dialog.system.allow_notifications_desc"),
+    ("tray_switch", "set_title", "dialog.system.show_tray"),
+    ("tray_switch", "set_subtitle", "dialog.system.show_tray_desc"),
+    ("super_download_switch", "set_title", "dialog.system.use_super_download"),
+    ("super_download_switch", "set_subtitle", "dialog.system.use_super_download_desc"),
+)
+
+# Translation key shown under the icon row for each fetch status
+_ICON_STATUS_KEYS = {
+    "loading": "dialog.icon.fetch_loading",
+    "success": "dialog.icon.fetch_success",
+    "custom": "dialog.icon.custom_selected",
+    "failure": "dialog.icon.fetch_failure",
+    "error": "dialog.icon.fetch_error",
+    "default": "",
+}
+
+
+@lru_cache(maxsize=1)
+def _get_icon_fetcher() -> "IconFetcher":
+    """Return the IconFetcher shared by all dialogs (reuses its HTTP session)."""
+    from ..core.icon_fetcher import IconFetcher
+
+    return IconFetcher()
+
+
+def _is_temp_icon(path: str) -> bool:
+    """Return True for icons fetched into a throwaway ``temp_*`` file."""
+    return Path(path).name.startswith("temp_")
+
+
+def _remove_icon_file(path: str) -> None:
+    """Delete an icon file, ignoring one that is already gone."""
+    try:
+        Path(path).unlink(missing_ok=True)
+    except OSError as exc:
+        logger.debug("Não foi possível remover ícone temporário %s: %s", path, exc)
+
+
+def _icon_cache_key(url: str) -> str:
+    """Return the fetch cache key for a URL.
+
+    The page title belongs to the exact page, so results are keyed by the
+    whole URL (minus any fragment) rather than by host.
+    """
+    return url.split("#", 1)[0]
+
+
+def _thumbnail_cache_path(src: Path) -> Path:
+    """Return the cached preview path for an icon file (keyed by path and mtime)."""
+    digest = hashlib.blake2b(
+        f"{src}:{src.stat().st_mtime_ns}".encode(), digest_size=8
+    ).hexdigest()
+    return XDGDirectories.get_cache_dir() / f"preview_{digest}.png"
+
+
+def _prune_previews(keep: Path) -> None:
+    """Delete every cached preview except the one just written.
+
+    Previews are only used to render the current pick, so older ones
+    (including those left by earlier sessions) are never read again.
+    """
+    for stale in keep.parent.glob("preview_*.png"):
+        if stale != keep:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.debug("Não foi possível remover pré-visualização %s: %s", stale, exc)
+
+
+def _preview_for(path: str) -> str:
+    """Return a small preview of a user-chosen icon, creating it if needed.
+
+    Falls back to the original file for formats Pillow cannot read (e.g. SVG).
+    """
+    from PIL import Image
+
+    src = Path(path)
+    try:
+        preview = _thumbnail_cache_path(src)
+        if not preview.exists():
+            with Image.open(src) as image:
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA")
+                image.thumbnail((128, 128), Image.Resampling.LANCZOS)
+                image.save(preview, "PNG", optimize=False)
+            _prune_previews(keep=preview)
+        return str(preview)
+    except Exception as exc:
+        logger.debug("Pré-visualização indisponível para %s: %s", path, exc)
+        return path
+
+
+@lru_cache(maxsize=1)
+def _initial_icon_folder() -> Optional[Path]:
+    """Return the first existing icon folder to open the icon chooser in."""
+    candidates = (
+        Path.home() / ".local" / "share" / "icons" / "hicolor" / "48x48" / "apps",
+        Path.home() / ".local" / "share" / "icons",
+        Path("/usr/share/icons/hicolor/48x48/apps"),
+        Path("/usr/share/icons"),
+    )
+    return next((base for base in candidates if base.exists()), None)
+
+
+def _has_required_fields(name: str, url: str) -> bool:
+    """Return True when both name and URL contain non-blank text."""
+    return bool(name.strip() and url.strip())
+
+
+@lru_cache(maxsize=32)
+def _derive_name_from_url(url: str) -> Optional[str]:
+    """Suggest a name based on the URL's hostname (memoized per URL string)."""
+    if not url:
+        return None
+
+    parsed = urlparse(url if "://" in url else f"http://{url}")
+    host = parsed.hostname or ""
+    if not host:
+        return None
+
+    host = host.strip()
+    if host.startswith("www."):
+        host = host[4:]
+
+    host = host.split(":")[0]
+    if not host:
+        return None
+
+    parts = [part for part in host.split(".") if part]
+    if not parts:
+        return None
+
+    candidate = parts[0]
+    generic_parts = {"www", "app", "web", "site"}
+    if candidate in generic_parts and len(parts) > 1:
+        candidate = parts[1]
+
+    candidate = candidate.replace("-", " ").replace("_", " ").strip()
+    if not candidate:
+        return None
+
+    return candidate.title()
+
+
+def _icon_status_label(status: str) -> str:
+    """Return the translated subtitle for an icon fetch status."""
+    key = _ICON_STATUS_KEYS.get(status)
+    return _(key) if key else ""
+
 
 class AddWebAppDialog(Adw.Dialog):
     """Dialog for adding a new webapp."""
 
+    # Translated category models shared by every dialog, keyed by language
+    _categories_cache: dict[str, Gtk.StringList] = {}
+
     def __init__(
         self,
         parent: Gtk.Window,
@@ -57,20 +250,37 @@ class AddWebAppDialog(Adw.Dialog):
 
         self.webapp_manager = webapp_manager
         self.webapp = webapp
-        self.icon_fetcher = IconFetcher()
+        self.icon_fetcher: Optional["IconFetcher"] = None
         self.fetched_icon_path: Optional[str] = None
         self.on_saved = on_saved
         self._is_edit = webapp is not None
         self._icon_button_status = "default"
+        self._last_status_key: Optional[tuple[str, str]] = None
+        self._applied_locale: Optional[str] = None
         self._language_subscription = None
         self._language_subscription = i18n_subscribe(self._on_language_changed)
         self._url_change_timeout_id: Optional[int] = None
+        self._url_deadline = 0
+        self._last_prefetched_url: Optional[str] = None
+        self._validate_source_id = 0
+        self._save_sensitive: Optional[bool] = None
         self._is_fetching_icon = False
+        self._icon_future: Optional[Future] = None
+        self._fetch_generation = 0
+        self._alive = True
+        # Fetch results owned by this dialog: key -> (icon_path, page_title, stored_at)
+        self._fetch_cache: "OrderedDict[str, tuple[str, Optional[str], float]]" = OrderedDict()
+        # In-flight fetches by cache key, so a later request can join a running prefetch
+        self._pending_fetches: dict[str, Future] = {}
+        # Temp icons written by this dialog's fetches, deleted on destroy unless saved
+        self._temp_icons: set[str] = set()
+        self._persisting_icon: Optional[str] = None
         self._updating_name_field = False
         self._name_was_edited_manually = False
         self._file_dialog: Optional[Gtk.FileDialog] = None
         self._custom_icon_selected = False
         self._custom_icon_selected_before_fetch = False
+        self._icon_changed = False
         self._metadata_refresh_pending = self._is_edit
 
         self.set_title(_("dialog.edit_title") if self._is_edit else _("dialog.new_title"))
@@ -83,6 +293,7 @@ class AddWebAppDialog(Adw.Dialog):
             self._load_webapp_data()
 
         self._apply_translations()
+        self._applied_locale = get_language()
         self.connect("destroy", self._on_destroy)
 
         logger.debug("AddWebAppDialog initialized")
@@ -90,11 +301,14 @@ class AddWebAppDialog(Adw.Dialog):
     def _build_ui(self) -> None:
         """Build dialog UI."""
         # Main content box
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        content_box.set_margin_top(24)
-        content_box.set_margin_bottom(24)
-        content_box.set_margin_start(24)
-        content_box.set_margin_end(24)
+        content_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL,
+            spacing=12,
+            margin_top=24,
+            margin_bottom=24,
+            margin_start=24,
+            margin_end=24,
+        )
 
         # Toolbar header
         header = Adw.HeaderBar()
@@ -140,9 +354,7 @@ class AddWebAppDialog(Adw.Dialog):
         self.category_row = category_row
 
         # Create string list for categories
-        self.categories_list = Gtk.StringList()
-        for cat in DEFAULT_CATEGORIES:
-            self.categories_list.append(get_category_label(cat.id))
+        self.categories_list = self._get_categories_model()
 
         category_row.set_model(self.categories_list)
         category_row.set_selected(0)
@@ -154,15 +366,12 @@ class AddWebAppDialog(Adw.Dialog):
         icon_group = Adw.PreferencesGroup()
         self.icon_group = icon_group
 
-        icon_button_row = Adw.ActionRow()
-        icon_button_row.set_activatable(True)
+        icon_button_row = Adw.ActionRow(activatable=True)
         icon_button_row.connect("activated", self._on_icon_row_activated)
         self.icon_button_row = icon_button_row
 
         # Icon image display
-        self.icon_image = Gtk.Image()
-        self.icon_image.set_pixel_size(48)
-        self.icon_image.set_from_icon_name("image-x-generic-symbolic")
+        self.icon_image = Gtk.Image(pixel_size=48, icon_name="image-x-generic-symbolic")
         icon_button_row.add_prefix(self.icon_image)
 
         image_gesture = Gtk.GestureClick()
@@ -177,13 +386,11 @@ class AddWebAppDialog(Adw.Dialog):
         self.nav_group = nav_group
 
         # Allow tabs
-        self.tabs_switch = Adw.SwitchRow()
-        self.tabs_switch.set_active(True)
+        self.tabs_switch = Adw.SwitchRow(active=True)
         nav_group.add(self.tabs_switch)
 
         # Allow popups
-        self.popups_switch = Adw.SwitchRow()
-        self.popups_switch.set_active(True)
+        self.popups_switch = Adw.SwitchRow(active=True)
         nav_group.add(self.popups_switch)
 
         content_box.append(nav_group)
@@ -193,26 +400,21 @@ class AddWebAppDialog(Adw.Dialog):
         self.system_group = system_group
 
         # Notifications
-        self.notif_switch = Adw.SwitchRow()
-        self.notif_switch.set_active(True)
+        self.notif_switch = Adw.SwitchRow(active=True)
         system_group.add(self.notif_switch)
 
         # Show in tray
-        self.tray_switch = Adw.SwitchRow()
-        self.tray_switch.set_active(False)
+        self.tray_switch = Adw.SwitchRow(active=False)
         system_group.add(self.tray_switch)
 
         # Use Super Download integration
-        self.super_download_switch = Adw.SwitchRow()
-        self.super_download_switch.set_active(False)
+        self.super_download_switch = Adw.SwitchRow(active=False)
         system_group.add(self.super_download_switch)
 
         content_box.append(system_group)
 
         # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_child(content_box)
-        scrolled.set_vexpand(True)
+        scrolled = Gtk.ScrolledWindow(child=content_box, vexpand=True)
 
         # Toolbar view
         toolbar_view = Adw.ToolbarView()
@@ -223,45 +425,54 @@ class AddWebAppDialog(Adw.Dialog):
 
     def _apply_translations(self) -> None:
         """Apply localized strings to widgets."""
+        self._apply_static_translations()
+        self._update_icon_status()
+        self._apply_category_model_translations()
+
+    def _apply_static_translations(self) -> None:
+        """Apply localized titles and labels (no model rebuild)."""
         self.set_title(_("dialog.edit_title") if self._is_edit else _("dialog.new_title"))
-        self.cancel_button.set_label(_("dialog.cancel"))
         self.save_button.set_label(_("dialog.save") if self._is_edit else _("dialog.create"))
-        self.basic_group.set_title(_("dialog.group.basic"))
-        self.name_entry.set_title(_("dialog.field.name"))
-        self.url_entry.set_title(_("dialog.field.url"))
-        self.category_row.set_title(_("dialog.field.category"))
-        self.icon_group.set_title(_("dialog.group.icon"))
-        self.icon_button_row.set_title(_("dialog.icon.fetch_auto"))
-        self.icon_button_row.set_subtitle(
-            _("dialog.icon.fetch_loading") if self._icon_button_status == "loading"
-            else _("dialog.icon.fetch_success") if self._icon_button_status == "success"
-            else _("dialog.icon.custom_selected") if self._icon_button_status == "custom"
-            else _("dialog.icon.fetch_failure") if self._icon_button_status == "failure"
-            else _("dialog.icon.fetch_error") if self._icon_button_status == "error"
-            else ""
-        )
-        self.nav_group.set_title(_("dialog.group.navigation"))
-        self.tabs_switch.set_title(_("dialog.navigation.allow_tabs"))
-        self.tabs_switch.set_subtitle(_("dialog.navigation.allow_tabs_desc"))
-        self.popups_switch.set_title(_("dialog.navigation.allow_popups"))
-        self.popups_switch.set_subtitle(_("dialog.navigation.allow_popups_desc"))
-        self.system_group.set_title(_("dialog.group.system"))
-        self.notif_switch.set_title(_("dialog.system.allow_notifications"))
-        self.notif_switch.set_subtitle(_("dialog.system.allow_notifications_desc"))
-        self.tray_switch.set_title(_("dialog.system.show_tray"))
-        self.tray_switch.set_subtitle(_("dialog.system.show_tray_desc"))
-        self.super_download_switch.set_title(_("dialog.system.use_super_download"))
-        self.super_download_switch.set_subtitle(_("dialog.system.use_super_download_desc"))
-
-        selected = self.category_row.get_selected()
-        self.categories_list = Gtk.StringList()
-        for cat in DEFAULT_CATEGORIES:
-            self.categories_list.append(get_category_label(cat.id))
-        self.category_row.set_model(self.categories_list)
-        if 0 <= selected < self.categories_list.get_n_items():
-            self.category_row.set_selected(selected)
-        else:
-            self.category_row.set_selected(0)
+        for attr, setter, key in _APPLY:
+            getattr(getattr(self, attr), setter)(_(key))
+
+    def _update_icon_status(self) -> None:
+        """Refresh the icon row subtitle for the current fetch status."""
+        status_key = (get_language(), self._icon_button_status)
+        if status_key != self._last_status_key:
+            self._last_status_key = status_key
+            self.icon_button_row.set_subtitle(_icon_status_label(self._icon_button_status))
+
+    def _apply_category_model_translations(self) -> None:
+        """Swap in the categories model for the current language."""
+        categories_list = self._get_categories_model()
+        if categories_list is not self.categories_list:
+            selected = self.category_row.get_selected()
+            self.categories_list = categories_list
+            # Coalesce model/selection notifications into a single relayout
+            self.category_row.freeze_notify()
+            try:
+                self.category_row.set_model(categories_list)
+                if 0 <= selected < categories_list.get_n_items():
+                    self.category_row.set_selected(selected)
+                else:
+                    self.category_row.set_selected(0)
+            finally:
+                self.category_row.thaw_notify()
+
+    @classmethod
+    def _get_categories_model(cls) -> Gtk.StringList:
+        """Return the translated categories model for the current language.
+
+        Returns:
+            Gtk.StringList shared by all dialogs using the same language
+        """
+        language = get_language()
+        model = cls._categories_cache.get(language)
+        if model is None:
+            model = Gtk.StringList.new([get_category_label(cid) for cid in _CATEGORY_IDS])
+            cls._categories_cache[language] = model
+        return model
 
     def _load_webapp_data(self) -> None:
         """Load webapp data into form (for editing)."""
@@ -275,18 +486,15 @@ class AddWebAppDialog(Adw.Dialog):
         self._name_was_edited_manually = True
 
         # Find and set category
-        if self.webapp.category:
-            for i, cat in enumerate(DEFAULT_CATEGORIES):
-                if cat.id == self.webapp.category:
-                    self.category_row.set_selected(i)
-                    break
+        index = _CATEGORY_INDEX.get(self.webapp.category)
+        if index is not None:
+            self.category_row.set_selected(index)
 
         # Load icon if exists
         if self.webapp.icon_path:
-            from pathlib import Path
             if Path(self.webapp.icon_path).exists():
                 self.fetched_icon_path = self.webapp.icon_path
-                self.icon_image.set_from_file(self.webapp.icon_path)
+                self._set_icon_preview(self.webapp.icon_path)
                 self._icon_button_status = "success"
 
         # Load settings
@@ -298,14 +506,36 @@ class AddWebAppDialog(Adw.Dialog):
             self.tray_switch.set_active(settings.show_tray)
             self.super_download_switch.set_active(settings.use_super_download)
 
-    def _on_language_changed(self, _language: str) -> None:
+    def _on_language_changed(self, language: str) -> None:
         """React to global language changes."""
+        if language == self._applied_locale:
+            return
+        self._applied_locale = language
         self._apply_translations()
 
     def _on_destroy(self, *_args) -> None:
-        """Cleanup translation listeners on destroy."""
+        """Cleanup listeners and pending work on destroy."""
+        self._alive = False
         if self._language_subscription:
             i18n_unsubscribe(self._language_subscription)
+            self._language_subscription = None
+        if self._icon_future is not None:
+            self._icon_future.cancel()
+            self._icon_future = None
+        if self._url_change_timeout_id is not None:
+            GLib.source_remove(self._url_change_timeout_id)
+            self._url_change_timeout_id = None
+        if self._validate_source_id:
+            GLib.source_remove(self._validate_source_id)
+            self._validate_source_id = 0
+        for future in self._pending_fetches.values():
+            future.cancel()
+        self._pending_fetches.clear()
+        self._fetch_cache.clear()
+        for path in self._temp_icons:
+            if path != self._persisting_icon:
+                _remove_icon_file(path)
+        self._temp_icons.clear()
 
     def _on_input_changed(self, entry: Adw.EntryRow) -> None:
         """Handle input changed.
@@ -313,11 +543,19 @@ class AddWebAppDialog(Adw.Dialog):
         Args:
             entry: Entry that changed
         """
-        # Enable save button only if name and URL are filled
-        name = self.name_entry.get_text().strip()
-        url = self.url_entry.get_text().strip()
-
-        self.save_button.set_sensitive(len(name) > 0 and len(url) > 0)
+        # Coalesce bursts of keystrokes into a single validation pass
+        if self._validate_source_id:
+            GLib.source_remove(self._validate_source_id)
+        self._validate_source_id = GLib.timeout_add(80, self._do_validate)
+
+    def _do_validate(self) -> bool:
+        """Enable save button only if name and URL are filled."""
+        self._validate_source_id = 0
+        sensitive = _has_required_fields(self.name_entry.get_text(), self.url_entry.get_text())
+        if sensitive != self._save_sensitive:
+            self._save_sensitive = sensitive
+            self.save_button.set_sensitive(sensitive)
+        return GLib.SOURCE_REMOVE
 
     def _on_name_changed(self, entry: Adw.EntryRow) -> None:
         """Track manual edits on the name field."""
@@ -334,30 +572,44 @@ class AddWebAppDialog(Adw.Dialog):
         Args:
             entry: URL entry that changed
         """
-        # Cancel previous timeout if exists
-        if self._url_change_timeout_id is not None:
-            GLib.source_remove(self._url_change_timeout_id)
-            self._url_change_timeout_id = None
-
         url = entry.get_text().strip()
         if url and not self._is_edit:
             self._custom_icon_selected = False
 
         if url and not self._is_edit:
-            fallback_name = self._derive_name_from_url(url)
+            fallback_name = _derive_name_from_url(url)
             if fallback_name:
                 self._set_name_from_title(fallback_name)
 
         # Only fetch automatically for new webapps; edits use explicit refresh
         if url and url.startswith(("http://", "https://")) and not self._is_edit:
-            # Wait 1.5 seconds after user stops typing
-            self._url_change_timeout_id = GLib.timeout_add(1500, self._auto_fetch_icon)
+            # Push the deadline forward; the single pending timer re-arms itself
+            # until 1.5 seconds have passed since the last keystroke
+            self._url_deadline = GLib.get_monotonic_time() + _URL_FETCH_DELAY_MS * 1000
+            if self._url_change_timeout_id is None:
+                self._url_change_timeout_id = GLib.timeout_add(
+                    _URL_FETCH_DELAY_MS, self._auto_fetch_icon
+                )
+            # Once a path separator follows the host, the host is complete:
+            # start fetching its root page while the debounce is still running
+            scheme, _sep, rest = url.partition("://")
+            host, slash, _path = rest.partition("/")
+            if slash and host:
+                self._prefetch_metadata(f"{scheme}://{host}/")
+        elif self._url_change_timeout_id is not None:
+            GLib.source_remove(self._url_change_timeout_id)
+            self._url_change_timeout_id = None
 
     def _on_url_focus_enter(
         self, _controller: Gtk.EventControllerFocus, *_args
     ) -> None:
         """Refresh metadata when the URL field gains focus during edit."""
-        if not self._is_edit or not self._metadata_refresh_pending:
+        if not self._is_edit:
+            url = self.url_entry.get_text().strip()
+            if url.startswith(("http://", "https://")):
+                self._prefetch_metadata(url)
+            return
+        if not self._metadata_refresh_pending:
             return
         self._metadata_refresh_pending = False
         self._request_metadata_refresh(force=True)
@@ -368,6 +620,12 @@ class AddWebAppDialog(Adw.Dialog):
 
     def _auto_fetch_icon(self) -> bool:
         """Automatically fetch icon in background."""
+        remaining_ms = (self._url_deadline - GLib.get_monotonic_time()) // 1000
+        if remaining_ms > 0:
+            # User kept typing: wait for the rest of the quiet period
+            self._url_change_timeout_id = GLib.timeout_add(remaining_ms, self._auto_fetch_icon)
+            return False
+
         self._url_change_timeout_id = None
 
         if not self._is_fetching_icon:
@@ -376,7 +634,7 @@ class AddWebAppDialog(Adw.Dialog):
         return False  # Don't repeat timeout
 
     def _fetch_icon_async(self, *, force: bool = False) -> None:
-        """Fetch icon in background thread to avoid blocking UI."""
+        """Fetch icon on the shared worker pool to avoid blocking UI."""
         url = self.url_entry.get_text().strip()
 
         if not url:
@@ -385,23 +643,126 @@ class AddWebAppDialog(Adw.Dialog):
         self._custom_icon_selected_before_fetch = self._custom_icon_selected
         self._is_fetching_icon = True
         self._icon_button_status = "loading"
-        self._apply_translations()
+        self._update_icon_status()
+
+        # Latest request wins: older results are dropped in _finish_icon_fetch
+        self._fetch_generation += 1
+        generation = self._fetch_generation
+
+        cache_key = _icon_cache_key(url)
+        pending = self._pending_fetches.get(cache_key)
+        previous = self._icon_future
+        if previous is not None and previous is not pending:
+            previous.cancel()  # no-op if the worker already started it
+        self._icon_future = None
+
+        # Explicit refreshes (Enter, focus during edit) always go to the network
+        cached = None if force else self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Usando ícone em cache para %s", cache_key)
+            GLib.idle_add(self._finish_cached_fetch, cached[0], cached[1], force, generation)
+            return
 
-        def fetch_in_thread():
-            try:
-                # Use webapp ID if editing, or generate unique temp ID for new webapp
-                icon_id = self.webapp.id if self._is_edit else f"temp_{uuid.uuid4()}"
-                icon_path, page_title = self.icon_fetcher.fetch_icon_and_title(
-                    url, icon_id
-                )
-                icon_path_str = str(icon_path) if icon_path else None
-                GLib.idle_add(self._on_icon_fetched, icon_path_str, page_title, force)
-            except Exception as e:
-                logger.error(f"Error fetching icon: {e}", exc_info=True)
-                GLib.idle_add(self._on_icon_fetch_error)
+        # Join a prefetch already running for this host instead of fetching twice
+        future = pending if pending is not None else self._submit_fetch(url, cache_key)
+        self._icon_future = future
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._finish_icon_fetch, f, force, generation)
+        )
+
+    def _submit_fetch(self, url: str, cache_key: str) -> Future:
+        """Start fetching icon and title for a URL on the worker pool."""
+        # Use webapp ID if editing, or generate unique temp ID for new webapp
+        icon_id = self.webapp.id if self._is_edit else f"temp_{uuid.uuid4()}"
+        if self.icon_fetcher is None:
+            self.icon_fetcher = _get_icon_fetcher()
+        future = _ICON_EXECUTOR.submit(self.icon_fetcher.fetch_icon_and_title, url, icon_id)
+        self._pending_fetches[cache_key] = future
+        future.add_done_callback(lambda f: GLib.idle_add(self._on_fetch_done, cache_key, f))
+        return future
+
+    def _on_fetch_done(self, key: str, future: Future) -> bool:
+        """Cache a finished fetch, or delete its icon if the dialog is gone (main thread)."""
+        if self._pending_fetches.get(key) is future:
+            del self._pending_fetches[key]
+        if future.cancelled() or future.exception() is not None:
+            return False
+        icon_path, page_title = future.result()
+        # Edits write the webapp's live icon, which a later save may replace: never cache it
+        if not icon_path or not _is_temp_icon(str(icon_path)):
+            return False
+        if not self._alive:
+            _remove_icon_file(str(icon_path))
+            return False
+        self._temp_icons.add(str(icon_path))
+        self._cache_put(key, str(icon_path), page_title)
+        return False
 
-        thread = threading.Thread(target=fetch_in_thread, daemon=True)
-        thread.start()
+    def _cache_get(self, key: str) -> Optional[tuple[str, Optional[str]]]:
+        """Return a fresh cached (icon_path, page_title) pair, if any."""
+        entry = self._fetch_cache.get(key)
+        if entry is None:
+            return None
+        icon_path, page_title, stored_at = entry
+        if time.monotonic() - stored_at > _ICON_CACHE_TTL or not Path(icon_path).exists():
+            del self._fetch_cache[key]
+            self._release_temp_icon(icon_path)
+            return None
+        self._fetch_cache.move_to_end(key)
+        return icon_path, page_title
+
+    def _cache_put(self, key: str, icon_path: str, page_title: Optional[str]) -> None:
+        """Store a successful fetch result, evicting the least recently used entry."""
+        previous = self._fetch_cache.get(key)
+        self._fetch_cache[key] = (icon_path, page_title, time.monotonic())
+        self._fetch_cache.move_to_end(key)
+        if previous is not None and previous[0] != icon_path:
+            self._release_temp_icon(previous[0])
+        while len(self._fetch_cache) > _ICON_CACHE_MAX_ENTRIES:
+            _key, (evicted_path, _title, _stored_at) = self._fetch_cache.popitem(last=False)
+            self._release_temp_icon(evicted_path)
+
+    def _release_temp_icon(self, path: str) -> None:
+        """Delete a temp icon that left the cache, unless it is the selected icon."""
+        if path == self.fetched_icon_path or path not in self._temp_icons:
+            return
+        self._temp_icons.discard(path)
+        _remove_icon_file(path)
+
+    def _prefetch_metadata(self, url: str) -> None:
+        """Speculatively fetch a URL so the debounced fetch hits the cache."""
+        cache_key = _icon_cache_key(url)
+        if cache_key == self._last_prefetched_url:
+            return
+        self._last_prefetched_url = cache_key
+        if cache_key in self._pending_fetches or self._cache_get(cache_key) is not None:
+            return
+        logger.debug("Pré-carregando metadados de %s", cache_key)
+        self._submit_fetch(url, cache_key)
+
+    def _finish_cached_fetch(
+        self, icon_path: str, page_title: Optional[str], force: bool, generation: int
+    ) -> bool:
+        """Apply a cached result unless the dialog closed or a newer fetch started."""
+        if not self._alive or generation != self._fetch_generation:
+            return False
+        return self._on_icon_fetched(icon_path, page_title, force)
+
+    def _finish_icon_fetch(self, future: Future, force: bool, generation: int) -> bool:
+        """Dispatch a completed fetch future to the result handlers (main thread)."""
+        if future is self._icon_future:
+            self._icon_future = None
+        if not self._alive or future.cancelled() or generation != self._fetch_generation:
+            return False
+
+        try:
+            icon_path, page_title = future.result()
+        except Exception as e:
+            logger.error(f"Error fetching icon: {e}", exc_info=True)
+            return self._on_icon_fetch_error()
+
+        icon_path_str = str(icon_path) if icon_path else None
+        return self._on_icon_fetched(icon_path_str, page_title, force)
 
     def _on_icon_fetched(
         self, icon_path: Optional[str], page_title: Optional[str], force_name: bool
@@ -421,8 +782,9 @@ class AddWebAppDialog(Adw.Dialog):
                 logger.debug("Ícone personalizado já definido; mantendo seleção existente")
             else:
                 self.fetched_icon_path = str(icon_path)
+                self._icon_changed = True
                 self._icon_button_status = "success"
-                self.icon_image.set_from_file(str(icon_path))
+                self._set_icon_preview(str(icon_path))
                 self._custom_icon_selected = False
                 logger.info("Icon fetched successfully")
         elif not self._custom_icon_selected:
@@ -435,12 +797,12 @@ class AddWebAppDialog(Adw.Dialog):
         if page_title and (force_name or not self._name_was_edited_manually):
             self._set_name_from_title(page_title, force=force_name)
         elif force_name:
-            fallback = self._derive_name_from_url(self.url_entry.get_text().strip())
+            fallback = _derive_name_from_url(self.url_entry.get_text().strip())
             if fallback:
                 self._set_name_from_title(fallback, force=True)
 
         self._custom_icon_selected_before_fetch = False
-        self._apply_translations()
+        self._update_icon_status()
         return False
 
     def _request_metadata_refresh(self, force: bool) -> None:
@@ -468,7 +830,7 @@ class AddWebAppDialog(Adw.Dialog):
             logger.debug("Ignoring fetch error because a custom icon is in use")
         elif self._custom_icon_selected_before_fetch and self.fetched_icon_path:
             try:
-                self.icon_image.set_from_file(self.fetched_icon_path)
+                self._set_icon_preview(self.fetched_icon_path)
                 self._custom_icon_selected = True
                 self._icon_button_status = "custom"
                 logger.debug("Restored previous custom icon after fetch error")
@@ -480,7 +842,7 @@ class AddWebAppDialog(Adw.Dialog):
             self._icon_button_status = "error"
             self.icon_image.set_from_icon_name("dialog-error-symbolic")
         self._custom_icon_selected_before_fetch = False
-        self._apply_translations()
+        self._update_icon_status()
         return False
 
     def _set_name_from_title(self, title: Optional[str], *, force: bool = False) -> None:
@@ -491,7 +853,7 @@ class AddWebAppDialog(Adw.Dialog):
         if not force and (self._is_edit or self._name_was_edited_manually):
             return
 
-        normalized = " ".join(title.split()).strip()
+        normalized = _WS_RE.sub(" ", title).strip()
         if not normalized:
             return
 
@@ -504,38 +866,17 @@ class AddWebAppDialog(Adw.Dialog):
         self._updating_name_field = False
         self._on_input_changed(self.name_entry)
 
-    def _derive_name_from_url(self, url: str) -> Optional[str]:
-        """Suggest a name based on the URL's hostname."""
-        if not url:
-            return None
-
-        parsed = urlparse(url if "://" in url else f"http://{url}")
-        host = parsed.hostname or ""
-        if not host:
-            return None
-
-        host = host.strip()
-        if host.startswith("www."):
-            host = host[4:]
-
-        host = host.split(":")[0]
-        if not host:
-            return None
-
-        parts = [part for part in host.split(".") if part]
-        if not parts:
-            return None
-
-        candidate = parts[0]
-        generic_parts = {"www", "app", "web", "site"}
-        if candidate in generic_parts and len(parts) > 1:
-            candidate = parts[1]
-
-        candidate = candidate.replace("-", " ").replace("_", " ").strip()
-        if not candidate:
-            return None
-
-        return candidate.title()
+    def _set_icon_preview(self, path: str) -> None:
+        """Show an icon file in the preview image, decoded at display size."""
+        size = self.icon_image.get_pixel_size() * max(1, self.get_scale_factor())
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size)
+            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        except GLib.Error as err:
+            logger.debug("Falha ao decodificar ícone %s: %s", path, err)
+            self.icon_image.set_from_file(path)
+            return
+        self.icon_image.set_from_paintable(texture)
 
     def _on_icon_row_activated(self, _row: Adw.ActionRow, *_args) -> None:
         """Handle clicks on the icon row."""
@@ -567,22 +908,16 @@ class AddWebAppDialog(Adw.Dialog):
 
         self._file_dialog = dialog
 
-        from pathlib import Path
-
-        candidates = [
-            Path.home() / ".local" / "share" / "icons" / "hicolor" / "48x48" / "apps",
-            Path.home() / ".local" / "share" / "icons",
-            Path("/usr/share/icons/hicolor/48x48/apps"),
-            Path("/usr/share/icons"),
-        ]
-
-        for base in candidates:
-            if base.exists():
-                try:
-                    dialog.set_initial_folder(Gio.File.new_for_path(str(base)))
-                except Exception as exc:
-                    logger.debug("Não foi possível definir pasta inicial do seletor de ícones: %s", exc)
-                break
+        base = _initial_icon_folder()
+        if base is not None and not base.exists():
+            # Folder vanished since it was probed: look again
+            _initial_icon_folder.cache_clear()
+            base = _initial_icon_folder()
+        if base is not None:
+            try:
+                dialog.set_initial_folder(Gio.File.new_for_path(str(base)))
+            except Exception as exc:
+                logger.debug("Não foi possível definir pasta inicial do seletor de ícones: %s", exc)
 
         parent_window = self.get_root()
         if not isinstance(parent_window, Gtk.Window):
@@ -615,63 +950,165 @@ class AddWebAppDialog(Adw.Dialog):
 
         self._apply_custom_icon(path)
 
-    def _persist_icon(self, webapp_id: str) -> Optional[str]:
-        """Copy current icon to the app icon directory and return its path."""
-        if not self.fetched_icon_path:
-            return None
+    @staticmethod
+    def _persist_icon_file(source: Path, final_path: Path) -> Optional[str]:
+        """Resize and store an icon in the app icon directory (worker thread).
 
-        source = Path(self.fetched_icon_path)
+        Args:
+            source: Icon chosen or fetched in the dialog
+            final_path: Destination path for the webapp icon
+
+        Returns:
+            Path to use as the webapp icon, or None if the source is missing
+        """
         if not source.exists():
             logger.warning("Icon source does not exist: %s", source)
             return None
 
-        icons_dir = XDGDirectories.get_icons_dir()
-        final_path = icons_dir / f"{webapp_id}.png"
+        # Pillow is only needed when saving; keep it out of the module import
+        from PIL import Image
+        import shutil
 
         try:
-            image = Image.open(source)
-            if image.mode not in ("RGB", "RGBA"):
-                image = image.convert("RGBA")
-            image.thumbnail((128, 128), Image.Resampling.LANCZOS)
-            image.save(final_path, "PNG", optimize=True)
-
-            if "temp_" in source.stem:
+            with Image.open(source) as image:
+                # Icons from IconFetcher are already small PNGs: copy the bytes as-is
+                if (
+                    source.suffix.lower() == ".png"
+                    and max(image.size) <= 128
+                    and image.mode in ("RGB", "RGBA")
+                ):
+                    shutil.copy2(source, final_path)
+                else:
+                    # Decode fully here, on the worker, before resampling
+                    image.load()
+                    if image.mode not in ("RGB", "RGBA"):
+                        image = image.convert("RGBA")
+                    image.thumbnail((128, 128), Image.Resampling.LANCZOS)
+                    image.save(final_path, "PNG", optimize=False, compress_level=6)
+
+            if _is_temp_icon(str(source)):
                 try:
                     source.unlink()
                 except OSError as exc:
                     logger.debug("Could not remove temp icon: %s", exc)
 
-            self.fetched_icon_path = str(final_path)
             return str(final_path)
 
         except Exception as exc:
-            logger.warning("Failed to persist icon for %s: %s", webapp_id, exc)
+            logger.warning("Failed to persist icon %s: %s", final_path.name, exc)
             try:
                 if source.suffix.lower() == ".png":
                     shutil.copy2(source, final_path)
-                    self.fetched_icon_path = str(final_path)
                     return str(final_path)
             except Exception:
                 pass
-            return self.fetched_icon_path
+            return str(source)
+
+    def _finish_save(
+        self,
+        webapp: WebApp,
+        *,
+        created: bool,
+        branding_changed: bool = True,
+        refresh_running: bool = False,
+    ) -> None:
+        """Persist the icon off the main thread, then finish integration.
+
+        Args:
+            webapp: Saved webapp
+            created: Whether the webapp was just created (vs. edited)
+            branding_changed: Whether name, URL, category or icon changed
+            refresh_running: Ask a running instance to reload its branding
+        """
+        launcher = (created, branding_changed, refresh_running)
+        final_path = XDGDirectories.get_icon_path(webapp.id)
+        source = Path(self.fetched_icon_path) if self.fetched_icon_path else None
+        if source is None or source == final_path:
+            # Nothing to convert (no icon, or the edit fetch already wrote it in place)
+            icon_path = str(final_path) if source is not None else None
+            self._on_icon_persisted(icon_path, webapp, launcher)
+            return
+
+        if _is_temp_icon(str(source)):
+            # Keep the temp file through dialog teardown until it is persisted
+            self._persisting_icon = str(source)
+        future = _ICON_RESIZE_POOL.submit(self._persist_icon_file, source, final_path)
+        future.add_done_callback(
+            lambda f: GLib.idle_add(self._on_icon_persisted, f, webapp, launcher)
+        )
+
+    def _on_icon_persisted(
+        self,
+        result: "Future | str | None",
+        webapp: WebApp,
+        launcher: tuple[bool, bool, bool],
+    ) -> bool:
+        """Store the persisted icon and sync the launcher entry (main thread).
+
+        Runs after the dialog has closed, so only non-widget state is used.
+        """
+        from ..core.desktop_integration import DesktopIntegration
+
+        created, branding_changed, refresh_running = launcher
+        persisted, self._persisting_icon = self._persisting_icon, None
+        icon_path: Optional[str] = None
+        try:
+            icon_path = result.result() if isinstance(result, Future) else result
+            if icon_path and icon_path != webapp.icon_path:
+                webapp = self.webapp_manager.update_webapp(webapp.id, icon_path=icon_path)
+
+            if created:
+                # Create .desktop file for launcher integration
+                DesktopIntegration.create_desktop_file(webapp)
+            elif branding_changed:
+                DesktopIntegration.update_desktop_file(webapp)
+                if refresh_running:
+                    self.webapp_manager.refresh_running_webapp(webapp.id)
+        except Exception as e:
+            logger.error(f"Error finishing webapp save: {e}", exc_info=True)
+
+        # Usually already consumed; kept only if it became the webapp's icon itself
+        if persisted is not None and icon_path != persisted:
+            _remove_icon_file(persisted)
+
+        # Notify parent to refresh
+        if self.on_saved:
+            self.on_saved()
+        return False
 
     def _apply_custom_icon(self, path: str) -> None:
         """Set a custom icon chosen by the user."""
         try:
-            self.icon_image.set_from_file(path)
+            # Render from a small cached preview; persistence still uses the original
+            self._set_icon_preview(_preview_for(path))
         except Exception as exc:
             logger.warning(f"Failed to load custom icon: {exc}")
             self._icon_button_status = "failure"
             self.icon_image.set_from_icon_name("image-missing-symbolic")
-            self._apply_translations()
+            self._update_icon_status()
             return
 
         self._is_fetching_icon = False
         self._custom_icon_selected = True
         self._custom_icon_selected_before_fetch = False
         self.fetched_icon_path = path
+        self._icon_changed = True
         self._icon_button_status = "custom"
-        self._apply_translations()
+        self._update_icon_status()
+
+    def _collect_switch_state(self) -> dict[str, bool]:
+        """Read the settings switches into WebAppSettings field values.
+
+        Returns:
+            Mapping of setting field name to switch state
+        """
+        return {
+            "allow_tabs": self.tabs_switch.get_active(),
+            "allow_popups": self.popups_switch.get_active(),
+            "enable_notif": self.notif_switch.get_active(),
+            "show_tray": self.tray_switch.get_active(),
+            "use_super_download": self.super_download_switch.get_active(),
+        }
 
     def _on_save_clicked(self, button: Gtk.Button) -> None:
         """Handle save button clicked.
@@ -688,62 +1125,42 @@ class AddWebAppDialog(Adw.Dialog):
 
         # Get selected category
         selected_index = self.category_row.get_selected()
-        category = DEFAULT_CATEGORIES[selected_index].id
+        category = _CATEGORY_IDS[selected_index]
 
         try:
             if self.webapp:
-                # Prepare icon source before deletion
-                temp_icon_path: Optional[Path] = None
-                if self.fetched_icon_path:
-                    source_path = Path(self.fetched_icon_path)
-                    if source_path.exists():
-                        temp_icon_path = (
-                            XDGDirectories.get_icons_dir()
-                            / f"temp_edit_{uuid.uuid4()}.png"
-                        )
-                        try:
-                            shutil.copy2(source_path, temp_icon_path)
-                            self.fetched_icon_path = str(temp_icon_path)
-                        except Exception as exc:
-                            logger.warning(
-                                "Could not prepare temporary icon for edit: %s", exc
-                            )
-
-                # Close and delete current webapp
-                self.webapp_manager.close_running_webapp(self.webapp.id)
-                self.webapp_manager.delete_webapp(self.webapp.id)
-
-                # Create new webapp with updated data
-                new_webapp, new_settings = self.webapp_manager.create_webapp(
-                    name, url, category
+                # Update the existing record in place (keeps id, profile and icon path)
+                previous = self.webapp
+                switch_state = self._collect_switch_state()
+                settings = self.webapp_manager.get_webapp_settings(previous.id)
+                settings_changed = settings is not None and any(
+                    getattr(settings, field_name) != value
+                    for field_name, value in switch_state.items()
                 )
 
-                new_settings.allow_tabs = self.tabs_switch.get_active()
-                new_settings.allow_popups = self.popups_switch.get_active()
-                new_settings.enable_notif = self.notif_switch.get_active()
-                new_settings.show_tray = self.tray_switch.get_active()
-                new_settings.use_super_download = self.super_download_switch.get_active()
-                self.webapp_manager.update_webapp_settings(new_settings)
-
-                icon_path = self._persist_icon(new_webapp.id)
-                if icon_path:
-                    updated = self.webapp_manager.update_webapp(
-                        new_webapp.id, icon_path=icon_path
-                    )
-                    if updated:
-                        new_webapp = updated
-
-                DesktopIntegration.create_desktop_file(new_webapp)
-
-                # Ensure no temp icon is left behind if it still exists
-                if temp_icon_path and temp_icon_path.exists():
-                    try:
-                        temp_icon_path.unlink()
-                    except OSError:
-                        pass
-
-                self.webapp = new_webapp
-                logger.info("WebApp replaced with new instance: %s", new_webapp.id)
+                webapp = self.webapp_manager.update_webapp(
+                    previous.id, name=name, url=url, category=category
+                )
+                if settings is not None:
+                    self.webapp_manager.update_webapp_settings(settings, **switch_state)
+
+                # Navigation/system settings and the start URL only apply on launch
+                restart_needed = settings_changed or webapp.url != previous.url
+                if restart_needed:
+                    self.webapp_manager.close_running_webapp(webapp.id)
+
+                branding_changed = self._icon_changed or (
+                    webapp.name, webapp.url, webapp.category
+                ) != (previous.name, previous.url, previous.category)
+
+                self.webapp = webapp
+                logger.info("WebApp updated in place: %s", webapp.id)
+                self._finish_save(
+                    webapp,
+                    created=False,
+                    branding_changed=branding_changed,
+                    refresh_running=not restart_needed,
+                )
             else:
                 # Create new webapp
                 webapp, settings = self.webapp_manager.create_webapp(
@@ -751,32 +1168,17 @@ class AddWebAppDialog(Adw.Dialog):
                 )
 
                 # Update settings with form values
-                settings.allow_tabs = self.tabs_switch.get_active()
-                settings.allow_popups = self.popups_switch.get_active()
-                settings.enable_notif = self.notif_switch.get_active()
-                settings.show_tray = self.tray_switch.get_active()
-                settings.use_super_download = self.super_download_switch.get_active()
-                self.webapp_manager.update_webapp_settings(settings)
-
-                # If icon was fetched, move it to the webapp's final icon path
-                icon_path = self._persist_icon(webapp.id)
-                if icon_path:
-                    webapp = self.webapp_manager.update_webapp(webapp.id, icon_path=icon_path)
-                    if not webapp:
-                        webapp = self.webapp_manager.get_webapp(webapp.id)
-
-                # Create .desktop file for launcher integration
-                DesktopIntegration.create_desktop_file(webapp)
+                self.webapp_manager.update_webapp_settings(
+                    settings, **self._collect_switch_state()
+                )
 
                 logger.info(f"WebApp created: {webapp.id}")
+                # If icon was fetched, move it to the webapp's final icon path
+                self._finish_save(webapp, created=True)
 
-            # Close dialog
+            # Close dialog right away; icon persistence completes in background
             self.close()
 
-            # Notify parent to refresh
-            if self.on_saved:
-                self.on_saved()
-
         except Exception as e:
             logger.error(f"Error saving webapp: {e}", exc_info=True)
             # TODO: Show error dialog
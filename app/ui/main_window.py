@@ -4,27 +4,115 @@ This module provides the main window UI for managing webapps,
 including the list view, search, and management actions.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
-import subprocess
+import os
 import sys
 
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, Gtk, Gdk, Pango
+gi.require_version("GdkPixbuf", "2.0")
+from gi.repository import Adw, Gio, GLib, GObject, Gtk, Gdk, GdkPixbuf
 
 from ..core.webapp_manager import WebAppManager
 from ..data.models import WebApp
-from ..utils.i18n import gettext as _, subscribe as i18n_subscribe, unsubscribe as i18n_unsubscribe
-from ..utils.logger import get_logger
+from ..utils.i18n import (
+    gettext as _,
+    get_language,
+    subscribe as i18n_subscribe,
+    unsubscribe as i18n_unsubscribe,
+)
+from ..utils.logger import Logger, get_logger
 from ..webengine.profile_manager import ProfileManager
+from .widgets.webapp_row import WebAppRow
+
+if TYPE_CHECKING:
+    from .add_dialog import AddWebAppDialog
 
 logger = get_logger(__name__)
 
+# Single worker for list queries so the main loop never waits on SQLite
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webapp-db")
+
+# Command prefix for launching a standalone webapp process
+_BASE_CMD = (sys.executable, "-m", "app.standalone_webapp")
+
+# Silence a launched webapp's stdout/stderr outside debug mode
+_QUIET_SPAWN_ACTIONS = (
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+)
+
+# Coalesce search keystrokes into a single query
+_SEARCH_DELAY_MS = 150
+
+# Application menu entries as (translation key, action)
+_MENU_ENTRIES = (
+    ("menu.preferences", "app.preferences"),
+    ("menu.about", "app.about"),
+    ("menu.quit", "app.quit"),
+)
+
+# Row icons are decoded once and shared, keyed by (path, mtime), least recently used first
+_ICON_TEXTURES_MAX = 256
+_ICON_TEXTURES: "OrderedDict[tuple[str, int], Gdk.Texture]" = OrderedDict()
+# Shared icon for webapps without a custom icon (and while one is decoding)
+_FALLBACK_ICON = Gio.ThemedIcon.new("applications-internet-symbolic")
+
 _STYLE_PROVIDER: Gtk.CssProvider | None = None
 
+_CSS_BYTES = b"""
+.super-webapp-search {
+    min-height: 44px;
+    border-radius: 12px;
+    padding: 0 12px;
+    border: 1px solid alpha(@borders, 0.45);
+    background-color: alpha(@view_bg_color, 0.9);
+}
+
+.super-webapp-search:focus-within {
+    border-color: alpha(@accent_color, 0.75);
+    box-shadow: 0 0 0 3px alpha(@accent_color, 0.2);
+}
+
+.super-webapp-row {
+    padding: 12px;
+    border-radius: 14px;
+    border: 1px solid alpha(@borders, 0.4);
+    background-color: @card_bg_color;
+}
+
+.super-webapp-row .image {
+    border-radius: 12px;
+}
+
+.super-webapp-button-box button {
+    min-height: 36px;
+    min-width: 36px;
+}
+
+.super-webapp-button-box button.destructive-action {
+    background-color: alpha(@destructive_bg_color, 0.55);
+    border-color: alpha(@destructive_bg_color, 0.6);
+    color: @destructive_fg_color;
+}
+
+.super-webapp-button-box button.destructive-action:hover {
+    background-color: alpha(@destructive_bg_color, 0.75);
+}
+
+.super-webapp-list row {
+    padding: 0;
+    border: none;
+    background-color: transparent;
+}
+"""
+
 
 def _ensure_styles_loaded() -> None:
     """Load shared CSS tweaks to align visuals with Super Download."""
@@ -32,55 +120,8 @@ def _ensure_styles_loaded() -> None:
     if _STYLE_PROVIDER is not None:
         return
 
-    css = """
-    .super-webapp-search {
-        min-height: 44px;
-        border-radius: 12px;
-        padding: 0 12px;
-        border: 1px solid alpha(@borders, 0.45);
-        background-color: alpha(@view_bg_color, 0.9);
-    }
-
-    .super-webapp-search:focus-within {
-        border-color: alpha(@accent_color, 0.75);
-        box-shadow: 0 0 0 3px alpha(@accent_color, 0.2);
-    }
-
-    .super-webapp-row {
-        padding: 12px;
-        border-radius: 14px;
-        border: 1px solid alpha(@borders, 0.4);
-        background-color: @card_bg_color;
-    }
-
-    .super-webapp-row .image {
-        border-radius: 12px;
-    }
-
-    .super-webapp-button-box button {
-        min-height: 36px;
-        min-width: 36px;
-    }
-
-    .super-webapp-button-box button.destructive-action {
-        background-color: alpha(@destructive_bg_color, 0.55);
-        border-color: alpha(@destructive_bg_color, 0.6);
-        color: @destructive_fg_color;
-    }
-
-    .super-webapp-button-box button.destructive-action:hover {
-        background-color: alpha(@destructive_bg_color, 0.75);
-    }
-
-    .super-webapp-list row {
-        padding: 0;
-        border: none;
-        background-color: transparent;
-    }
-    """
-
     provider = Gtk.CssProvider()
-    provider.load_from_data(css.encode("utf-8"))
+    provider.load_from_data(_CSS_BYTES)
 
     display = Gdk.Display.get_default()
     if display is not None:
@@ -92,6 +133,72 @@ def _ensure_styles_loaded() -> None:
     _STYLE_PROVIDER = provider
 
 
+@cache
+def _add_dialog_cls() -> type["AddWebAppDialog"]:
+    """Import the add/edit dialog on first use."""
+    from .add_dialog import AddWebAppDialog
+
+    return AddWebAppDialog
+
+
+def _icon_stamp(path: Optional[str]) -> int:
+    """Return the modification stamp of an icon file (0 if missing).
+
+    Icons are rewritten in place when a webapp is edited, so the stamp is
+    what tells a stale decoded texture apart from the current file.
+    """
+    if not path:
+        return 0
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_webapps_with_stamps(
+    webapp_manager: WebAppManager,
+) -> tuple[list[WebApp], dict[str, int]]:
+    """Load all webapps and stat their icons (runs on the database worker).
+
+    Args:
+        webapp_manager: Manager used to query the database
+
+    Returns:
+        WebApps in list order and their icon stamps keyed by webapp ID
+    """
+    webapps = webapp_manager.get_all_webapps()
+    return webapps, {webapp.id: _icon_stamp(webapp.icon_path) for webapp in webapps}
+
+
+def _get_icon_texture(key: tuple[str, int]) -> Optional[Gdk.Texture]:
+    """Return a cached icon texture, marking it as recently used."""
+    texture = _ICON_TEXTURES.get(key)
+    if texture is not None:
+        _ICON_TEXTURES.move_to_end(key)
+    return texture
+
+
+def _store_icon_texture(key: tuple[str, int], texture: Gdk.Texture) -> None:
+    """Cache a decoded icon, dropping older versions of the same file."""
+    path = key[0]
+    for stale in [k for k in _ICON_TEXTURES if k[0] == path]:
+        del _ICON_TEXTURES[stale]
+    _ICON_TEXTURES[key] = texture
+    while len(_ICON_TEXTURES) > _ICON_TEXTURES_MAX:
+        _ICON_TEXTURES.popitem(last=False)
+
+
+class WebAppItem(GObject.Object):
+    """List model item wrapping a WebApp for the virtualized list view."""
+
+    __gtype_name__ = "SuperWebAppItem"
+
+    def __init__(self, webapp: WebApp, icon_stamp: int = 0) -> None:
+        super().__init__()
+        self.webapp = webapp
+        self.icon_stamp = icon_stamp
+
+
 class MainWindow(Adw.ApplicationWindow):
     """Main application window.
 
@@ -125,7 +232,6 @@ class MainWindow(Adw.ApplicationWindow):
         icon_path = Path(__file__).parent.parent / "data" / "icon.png"
         if icon_path.exists():
             try:
-                from gi.repository import GdkPixbuf
                 pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
                     str(icon_path), 48, 48, True
                 )
@@ -136,13 +242,30 @@ class MainWindow(Adw.ApplicationWindow):
 
         self._language_subscription = None
         self._language_subscription = i18n_subscribe(self._on_language_changed)
-
+        # Row tooltips, translated once per language in _apply_translations
+        self._tooltips: tuple[str, ...] = ()
+        self._translated_language: Optional[str] = None
+        self._menu_cache: dict[str, Gio.Menu] = {}
+        self._load_seq = 0
+        self._webapps_by_id: dict[str, WebApp] = {}
+        # Icon mtime stamps by webapp ID, taken on the worker at load time
+        self._icon_stamps: dict[str, int] = {}
+        self._search_index: tuple[tuple[WebApp, str], ...] = ()
+        self._last_query = ""
+        self._last_matches: tuple[tuple[WebApp, str], ...] = ()
+        # Per-window memo of query -> matches, cleared whenever the index is rebuilt
+        self._match_cached = lru_cache(maxsize=64)(self._match)
+
+        self._install_row_actions()
         self._build_ui()
         self._load_webapps()
-        self._apply_translations()
+        self._apply_translations(force=True)
 
         self.connect("destroy", self._on_destroy)
 
+        # Import the add/edit dialog once the window is idle, so the first click doesn't pay for it
+        GLib.idle_add(self._prewarm_dialogs, priority=GLib.PRIORITY_LOW)
+
         logger.debug("MainWindow initialized")
 
     def _build_ui(self) -> None:
@@ -163,7 +286,6 @@ class MainWindow(Adw.ApplicationWindow):
         # Menu button
         menu_button = Gtk.MenuButton()
         menu_button.set_icon_name("open-menu-symbolic")
-        menu_button.set_menu_model(self._create_menu())
         header_bar.pack_end(menu_button)
         self.menu_button = menu_button
 
@@ -183,6 +305,8 @@ class MainWindow(Adw.ApplicationWindow):
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_hexpand(True)
         self.search_entry.add_css_class("super-webapp-search")
+        # The entry coalesces keystrokes before emitting search-changed
+        self.search_entry.set_search_delay(_SEARCH_DELAY_MS)
         self.search_entry.connect("search-changed", self._on_search_changed)
 
         search_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -201,187 +325,368 @@ class MainWindow(Adw.ApplicationWindow):
         scrolled.set_margin_end(12)
         scrolled.set_margin_bottom(12)
 
-        # List box for webapps
-        self.list_box = Gtk.ListBox()
-        self.list_box.add_css_class("boxed-list")
-        self.list_box.add_css_class("super-webapp-list")
-        self.list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        self.list_box.connect("row-activated", self._on_row_activated)
+        # Virtualized list: only rows on screen are instantiated and recycled
+        self.store = Gio.ListStore.new(WebAppItem)
+        self.store.connect("items-changed", self._on_store_items_changed)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+        factory.connect("unbind", self._on_row_unbind)
+
+        self.list_view = Gtk.ListView.new(Gtk.NoSelection.new(self.store), factory)
+        self.list_view.add_css_class("boxed-list")
+        self.list_view.add_css_class("super-webapp-list")
+        # GtkListBox activated rows on a single click; GtkListView needs opting in
+        self.list_view.set_single_click_activate(True)
+        self.list_view.connect("activate", self._on_row_activated)
+        self._items: dict[str, WebAppItem] = {}
+        self._icon_waiters: dict[tuple[str, int], list[WebAppRow]] = {}
+
+        scrolled.set_child(self.list_view)
 
         # Placeholder for empty state
         placeholder = Adw.StatusPage()
         placeholder.set_icon_name("applications-internet-symbolic")
         self.status_placeholder = placeholder
-        self.list_box.set_placeholder(self.status_placeholder)
 
-        scrolled.set_child(self.list_box)
-        content_box.append(scrolled)
+        # Neutral page shown until the first background load finishes
+        spinner = Gtk.Spinner()
+        spinner.set_size_request(32, 32)
+        spinner.set_halign(Gtk.Align.CENTER)
+        spinner.set_valign(Gtk.Align.CENTER)
+        spinner.start()
+
+        self.list_stack = Gtk.Stack()
+        self.list_stack.set_vexpand(True)
+        self.list_stack.add_named(spinner, "loading")
+        self.list_stack.add_named(scrolled, "list")
+        self.list_stack.add_named(placeholder, "empty")
+        self.list_stack.set_visible_child_name("loading")
+        self._loading_spinner = spinner
+        content_box.append(self.list_stack)
 
         toolbar_view.set_content(content_box)
 
-    def _create_menu(self) -> Gio.Menu:
-        """Create application menu.
+    def _create_menu(self, language: str) -> Gio.Menu:
+        """Create application menu for a language, reusing earlier builds.
+
+        Args:
+            language: Current UI language code
 
         Returns:
             Gio.Menu instance
         """
-        menu = Gio.Menu()
-
-        menu.append(_("menu.preferences"), "app.preferences")
-        menu.append(_("menu.about"), "app.about")
-        menu.append(_("menu.quit"), "app.quit")
-
+        menu = self._menu_cache.get(language)
+        if menu is None:
+            menu = Gio.Menu()
+            for key, action in _MENU_ENTRIES:
+                menu.append(_(key), action)
+            self._menu_cache[language] = menu
         return menu
 
     def _load_webapps(self) -> None:
-        """Load webapps from database and populate list."""
-        # Clear existing items
-        while True:
-            row = self.list_box.get_row_at_index(0)
-            if row is None:
-                break
-            self.list_box.remove(row)
+        """Load webapps from database on the worker and populate list.
 
-        # Load and add webapps
-        webapps = self.webapp_manager.get_all_webapps()
+        Each load supersedes the previous one; stale results are dropped.
+        """
+        self._load_seq += 1
+        seq = self._load_seq
+        future = _DB_EXECUTOR.submit(_load_webapps_with_stamps, self.webapp_manager)
+        future.add_done_callback(lambda f: GLib.idle_add(self._populate_rows, seq, f))
 
-        for webapp in webapps:
-            row = self._create_webapp_row(webapp)
-            self.list_box.append(row)
+    def _populate_rows(self, seq: int, future: Future) -> bool:
+        """Index the loaded webapps and show them on the main loop.
+
+        Args:
+            seq: Submission number of the load
+            future: Completed load future
+
+        Returns:
+            GLib.SOURCE_REMOVE to run once
+        """
+        if seq != self._load_seq:
+            return GLib.SOURCE_REMOVE
+
+        try:
+            webapps, icon_stamps = future.result()
+        except Exception as e:
+            logger.error(f"Failed to load webapps: {e}", exc_info=True)
+            self._finish_first_load()
+            return GLib.SOURCE_REMOVE
+
+        self._webapps_by_id = {webapp.id: webapp for webapp in webapps}
+        self._icon_stamps = icon_stamps
+
+        # Searches filter this index in memory instead of querying the database
+        self._search_index = tuple(
+            (webapp, f"{webapp.name}\x00{webapp.url}".casefold()) for webapp in webapps
+        )
+        self._match_cached.cache_clear()
+        self._last_query = ""
+        self._last_matches = self._search_index
+        self._apply_filter(self.search_entry.get_text())
+        self._finish_first_load()
 
         logger.debug(f"Loaded {len(webapps)} webapps")
-        self._apply_translations()
+        return GLib.SOURCE_REMOVE
+
+    def _apply_filter(self, query: str) -> None:
+        """Show the webapps whose name or URL contains every query term.
+
+        Args:
+            query: Search text (case-insensitive, whitespace-separated terms)
+        """
+        needle = " ".join(query.casefold().split())
+        matches = self._match_cached(needle)
+        self._last_query = needle
+        self._last_matches = matches
+        self._show_webapps([webapp for webapp, _text in matches])
+
+    def _match(self, needle: str) -> tuple[tuple[WebApp, str], ...]:
+        """Scan the search index for a normalized query.
 
-    def _create_webapp_row(self, webapp: WebApp) -> Gtk.ListBoxRow:
-        """Create list row for a webapp.
+        When the query extends the previous one, only the previous matches
+        are scanned. Results are memoized per query until the next load.
 
         Args:
-            webapp: WebApp to create row for
+            needle: Casefolded query with single spaces between terms
 
         Returns:
-            Gtk.ListBoxRow widget
+            Matching (webapp, search text) index entries, in list order
+        """
+        if not needle:
+            return self._search_index
+
+        terms = needle.split(" ")
+        if needle.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = self._search_index
+
+        if len(terms) == 1:
+            return tuple(entry for entry in candidates if needle in entry[1])
+        return tuple(
+            entry for entry in candidates if all(term in entry[1] for term in terms)
+        )
+
+    def _show_webapps(self, webapps: list[WebApp]) -> None:
+        """Reconcile the list model with the given webapps.
+
+        Items are reused by webapp ID and only the range between the unchanged
+        head and tail of the list is spliced, so typical add/edit/delete flows
+        touch a single row.
+
+        Args:
+            webapps: WebApps to display, in order
+        """
+        old_items: list[WebAppItem] = list(self.store)
+        new_items: list[WebAppItem] = []
+        changed: set[str] = set()
+
+        for webapp in webapps:
+            stamp = self._icon_stamps.get(webapp.id, 0)
+            item = self._items.get(webapp.id)
+            if item is None:
+                item = WebAppItem(webapp, stamp)
+            elif item.webapp != webapp or item.icon_stamp != stamp:
+                item.webapp = webapp
+                item.icon_stamp = stamp
+                changed.add(webapp.id)
+            new_items.append(item)
+
+        self._items = {item.webapp.id: item for item in new_items}
+
+        def unchanged(old: WebAppItem, new: WebAppItem) -> bool:
+            return old is new and new.webapp.id not in changed
+
+        limit = min(len(old_items), len(new_items))
+        head = 0
+        while head < limit and unchanged(old_items[head], new_items[head]):
+            head += 1
+        tail = 0
+        while tail < limit - head and unchanged(old_items[-1 - tail], new_items[-1 - tail]):
+            tail += 1
+
+        removed = len(old_items) - head - tail
+        added = new_items[head:len(new_items) - tail]
+        if removed or added:
+            self.store.splice(head, removed, added)
+
+    def _finish_first_load(self) -> None:
+        """Leave the loading page once the first load has completed."""
+        if self._loading_spinner is None:
+            return
+        self._loading_spinner.stop()
+        self._loading_spinner = None
+        self._on_store_items_changed(self.store)
+
+    def _on_store_items_changed(self, store: Gio.ListStore, *_args) -> None:
+        """Toggle the empty-state placeholder with the model size."""
+        if self._loading_spinner is not None:
+            return
+        self.list_stack.set_visible_child_name("list" if store.get_n_items() else "empty")
+
+    def _on_row_setup(
+        self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        """Create a recyclable list row.
+
+        Args:
+            _factory: Factory emitting the signal
+            list_item: List item that will own the row widgets
+        """
+        list_item.set_child(WebAppRow())
+
+    def _on_row_bind(
+        self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        """Fill a recycled row with the data of its webapp.
+
+        Args:
+            _factory: Factory emitting the signal
+            list_item: List item being bound to a model position
         """
-        row = Gtk.ListBoxRow()
-        row.set_activatable(True)
-        row.set_selectable(False)
-        row.set_margin_top(4)
-        row.set_margin_bottom(4)
-
-        # Store webapp ID in row data
-        row.webapp_id = webapp.id
-
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        main_box.add_css_class("super-webapp-row")
-        main_box.add_css_class("card")
-        main_box.set_margin_start(12)
-        main_box.set_margin_end(12)
-        main_box.set_margin_top(8)
-        main_box.set_margin_bottom(8)
-        main_box.set_hexpand(True)
-        row.set_child(main_box)
-
-        # Icon
+        item = list_item.get_item()
+        webapp = item.webapp
+        row = list_item.get_child()
+
+        row.icon_key = None
+        texture = None
         if webapp.icon_path:
-            icon = Gtk.Image.new_from_file(webapp.icon_path)
+            key = (webapp.icon_path, item.icon_stamp)
+            texture = _get_icon_texture(key)
+            if texture is None:
+                row.icon_key = key
+                self._load_row_icon(row, key)
+
+        if texture is not None:
+            row.icon_widget.set_from_paintable(texture)
         else:
-            icon = Gtk.Image.new_from_icon_name("applications-internet-symbolic")
-
-        icon.set_pixel_size(48)
-        icon.set_valign(Gtk.Align.CENTER)
-        main_box.append(icon)
-
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        info_box.set_hexpand(True)
-        main_box.append(info_box)
-
-        name_label = Gtk.Label(label=webapp.name, xalign=0)
-        name_label.add_css_class("title-4")
-        name_label.set_ellipsize(Pango.EllipsizeMode.END)
-        info_box.append(name_label)
-
-        url_label = Gtk.Label(label=webapp.url, xalign=0)
-        url_label.add_css_class("dim-label")
-        url_label.set_ellipsize(Pango.EllipsizeMode.END)
-        url_label.set_wrap(True)
-        info_box.append(url_label)
-
-        # Action buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        button_box.add_css_class("super-webapp-button-box")
-        button_box.set_valign(Gtk.Align.CENTER)
-        main_box.append(button_box)
-
-        # Launch button
-        launch_button = Gtk.Button()
-        launch_button.set_icon_name("media-playback-start-symbolic")
-        launch_button.set_tooltip_text(_("main.launch.tooltip"))
-        launch_button.connect("clicked", self._on_launch_clicked, webapp.id)
-        button_box.append(launch_button)
-        row.launch_button = launch_button  # type: ignore[attr-defined]
-
-        # Settings button
-        settings_button = Gtk.Button()
-        settings_button.set_icon_name("emblem-system-symbolic")
-        settings_button.set_tooltip_text(_("main.settings.tooltip"))
-        settings_button.connect("clicked", self._on_settings_clicked, webapp.id)
-        button_box.append(settings_button)
-        row.settings_button = settings_button  # type: ignore[attr-defined]
-
-        # Delete button
-        delete_button = Gtk.Button()
-        delete_button.set_icon_name("user-trash-symbolic")
-        delete_button.set_tooltip_text(_("main.delete.tooltip"))
-        delete_button.add_css_class("destructive-action")
-        delete_button.connect("clicked", self._on_delete_clicked, webapp.id)
-        button_box.append(delete_button)
-        row.delete_button = delete_button  # type: ignore[attr-defined]
-
-        for button in (launch_button, settings_button, delete_button):
-            button.set_valign(Gtk.Align.CENTER)
-
-        row.name_label = name_label  # type: ignore[attr-defined]
-        row.url_label = url_label  # type: ignore[attr-defined]
-        row.icon_widget = icon  # type: ignore[attr-defined]
-
-        return row
-
-    def _apply_translations(self) -> None:
-        """Apply translated strings to UI elements."""
-        self.set_title(_("app.title"))
-        if hasattr(self, "title_label"):
-            self.title_label.set_label(_("app.title"))
+            row.icon_widget.set_from_gicon(_FALLBACK_ICON)
+
+        row.name_label.set_label(webapp.name)
+        row.url_label.set_label(webapp.url)
+
+        for button, tooltip in zip(row.buttons, self._tooltips):
+            button.set_tooltip_text(tooltip)
+
+        # Buttons trigger the window's row.* actions with the webapp ID as target
+        target = GLib.Variant("s", webapp.id)
+        for button in row.buttons:
+            button.set_action_target_value(target)
+
+    def _load_row_icon(self, row: WebAppRow, key: tuple[str, int]) -> None:
+        """Decode a row icon off the main loop, sharing in-flight loads.
+
+        Args:
+            row: Row widget waiting for the icon
+            key: Icon (path, stamp) cache key
+        """
+        waiters = self._icon_waiters.get(key)
+        if waiters is not None:
+            waiters.append(row)
+            return
+
+        try:
+            stream = Gio.File.new_for_path(key[0]).read(None)
+        except GLib.Error as e:
+            logger.debug(f"Could not open icon {key[0]}: {e}")
+            return
+
+        self._icon_waiters[key] = [row]
+        size = row.icon_widget.get_pixel_size() * row.get_scale_factor()
+        GdkPixbuf.Pixbuf.new_from_stream_at_scale_async(
+            stream, size, size, True, None, self._on_row_icon_loaded, key, stream
+        )
+
+    def _on_row_icon_loaded(
+        self, _source, result: Gio.AsyncResult, key: tuple[str, int], stream: Gio.InputStream
+    ) -> None:
+        """Cache a decoded icon and show it on rows still bound to it."""
+        rows = self._icon_waiters.pop(key, [])
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_stream_finish(result)
+        except GLib.Error as e:
+            logger.debug(f"Could not decode icon {key[0]}: {e}")
+            return
+        finally:
+            stream.close(None)
+
+        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        _store_icon_texture(key, texture)
+        for row in rows:
+            if row.icon_key == key:
+                row.icon_key = None
+                row.icon_widget.set_from_paintable(texture)
+
+    def _on_row_unbind(
+        self, _factory: Gtk.SignalListItemFactory, list_item: Gtk.ListItem
+    ) -> None:
+        """Detach a row leaving the view from its pending icon load.
+
+        Args:
+            _factory: Factory emitting the signal
+            list_item: List item being unbound
+        """
+        list_item.get_child().icon_key = None
+
+    def _apply_translations(self, force: bool = False) -> bool:
+        """Apply translated strings to UI elements.
+
+        Args:
+            force: Apply even if the language has not changed since last time
+
+        Returns:
+            True if the strings were (re)applied
+        """
+        language = get_language()
+        if not force and language == self._translated_language:
+            return False
+        self._translated_language = language
+
+        title = _("app.title")
+        self.set_title(title)
+        self.title_label.set_label(title)
         self.new_button.set_label(_("main.new_webapp"))
         self.search_entry.set_placeholder_text(_("main.search_placeholder"))
         self.status_placeholder.set_title(_("main.status.title"))
         self.status_placeholder.set_description(_("main.status.description"))
-
-        row_widget = self.list_box.get_first_child()
-        while row_widget:
-            if isinstance(row_widget, Gtk.ListBoxRow):
-                launch_btn = getattr(row_widget, "launch_button", None)
-                if isinstance(launch_btn, Gtk.Button):
-                    launch_btn.set_tooltip_text(_("main.launch.tooltip"))
-                settings_btn = getattr(row_widget, "settings_button", None)
-                if isinstance(settings_btn, Gtk.Button):
-                    settings_btn.set_tooltip_text(_("main.settings.tooltip"))
-                delete_btn = getattr(row_widget, "delete_button", None)
-                if isinstance(delete_btn, Gtk.Button):
-                    delete_btn.set_tooltip_text(_("main.delete.tooltip"))
-            row_widget = row_widget.get_next_sibling()
+        self._tooltips = self._translate_tooltips()
 
         # Update menu labels
-        if hasattr(self, "menu_button"):
-            menu_model = self._create_menu()
-            self.menu_button.set_menu_model(menu_model)
+        self.menu_button.set_menu_model(self._create_menu(language))
+        return True
+
+    @staticmethod
+    def _translate_tooltips() -> tuple[str, str, str]:
+        """Translate the row button tooltips.
+
+        Returns:
+            Tooltips for the launch, settings and delete buttons
+        """
+        return (
+            _("main.launch.tooltip"),
+            _("main.settings.tooltip"),
+            _("main.delete.tooltip"),
+        )
 
     def _on_language_changed(self, _language: str) -> None:
         """Handle language change notification."""
-        self._apply_translations()
+        if not self._apply_translations():
+            return
+
+        # Re-bind only the visible rows so they pick up the new tooltips
+        n_items = self.store.get_n_items()
+        if n_items:
+            self.store.items_changed(0, n_items, n_items)
 
     def _on_destroy(self, *_args) -> None:
         """Cleanup callbacks on destroy."""
         if self._language_subscription:
             i18n_unsubscribe(self._language_subscription)
+        # Drop any query result still in flight
+        self._load_seq += 1
 
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
         """Handle search text changed.
@@ -392,29 +697,19 @@ class MainWindow(Adw.ApplicationWindow):
         query = entry.get_text()
         logger.debug(f"Search query: {query}")
 
-        # Clear list
-        while True:
-            row = self.list_box.get_row_at_index(0)
-            if row is None:
-                break
-            self.list_box.remove(row)
-
         # Search and populate
-        webapps = self.webapp_manager.search_webapps(query)
-
-        for webapp in webapps:
-            row = self._create_webapp_row(webapp)
-            self.list_box.append(row)
+        self._apply_filter(query)
 
-    def _on_row_activated(self, list_box: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
+    def _on_row_activated(self, list_view: Gtk.ListView, position: int) -> None:
         """Handle row activation (double-click or Enter).
 
         Args:
-            list_box: List box widget
-            row: Activated row
+            list_view: List view widget
+            position: Model position of the activated row
         """
-        if hasattr(row, "webapp_id"):
-            self.launch_webapp(row.webapp_id)
+        item = self.store.get_item(position)
+        if item is not None:
+            self.launch_webapp(item.webapp)
 
     def _on_new_webapp_clicked(self, button: Gtk.Button) -> None:
         """Handle new webapp button clicked.
@@ -423,95 +718,137 @@ class MainWindow(Adw.ApplicationWindow):
             button: Button widget
         """
         logger.info("New webapp button clicked")
-        from .add_dialog import AddWebAppDialog
-
-        dialog = AddWebAppDialog(
+        dialog = _add_dialog_cls()(
             self, self.webapp_manager, on_saved=self._load_webapps
         )
         dialog.present(self)
 
-    def _on_launch_clicked(self, button: Gtk.Button, webapp_id: str) -> None:
-        """Handle launch button clicked.
+    @staticmethod
+    def _prewarm_dialogs() -> bool:
+        """Load the add/edit dialog module ahead of the first click.
+
+        Returns:
+            GLib.SOURCE_REMOVE to run once
+        """
+        _add_dialog_cls()
+        return GLib.SOURCE_REMOVE
+
+    def _install_row_actions(self) -> None:
+        """Install the row.* actions targeted by the list row buttons."""
+        group = Gio.SimpleActionGroup()
+        for name, callback in (
+            ("launch", self._on_launch_action),
+            ("settings", self._on_settings_action),
+            ("delete", self._on_delete_action),
+        ):
+            action = Gio.SimpleAction.new(name, GLib.VariantType.new("s"))
+            action.connect("activate", callback)
+            group.add_action(action)
+        self.insert_action_group("row", group)
+
+    def _on_launch_action(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
+        """Handle a row's launch button."""
+        self.launch_webapp(parameter.get_string())
+
+    def _on_settings_action(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
+        """Handle a row's settings button."""
+        webapp = self._resolve_webapp(parameter.get_string())
+        if webapp:
+            self._show_settings(webapp)
+
+    def _on_delete_action(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
+        """Handle a row's delete button."""
+        webapp = self._resolve_webapp(parameter.get_string())
+        if webapp:
+            self._show_delete_confirm(webapp)
+
+    def _resolve_webapp(self, webapp_id: str) -> Optional[WebApp]:
+        """Look up a webapp in the loaded list, falling back to the database.
 
         Args:
-            button: Button widget
-            webapp_id: WebApp ID to launch
+            webapp_id: WebApp ID
+
+        Returns:
+            WebApp instance or None if not found
         """
-        self.launch_webapp(webapp_id)
+        webapp = self._webapps_by_id.get(webapp_id)
+        if webapp is None:
+            webapp = self.webapp_manager.get_webapp(webapp_id)
+        return webapp
+
+    def launch_webapp(self, webapp: WebApp | str) -> None:
+        """Launch webapp in separate process.
 
-    def launch_webapp(self, webapp_id: str) -> None:
-        """Launch webapp in separate process."""
+        Args:
+            webapp: WebApp instance, or its ID
+        """
+        webapp_id = webapp if isinstance(webapp, str) else webapp.id
         logger.info(f"Launching webapp in separate process: {webapp_id}")
 
         self.webapp_manager.record_webapp_opened(webapp_id)
 
-        webapp = self.webapp_manager.get_webapp(webapp_id)
+        if isinstance(webapp, str):
+            webapp = self._resolve_webapp(webapp_id)
         if not webapp:
             logger.error(f"WebApp not found: {webapp_id}")
             return
 
         # Launch webapp in separate process
         try:
-            cmd = [
-                sys.executable,
-                "-m",
-                "app.standalone_webapp",
-                webapp_id,
-            ]
-
             # Add debug flag if in debug mode
-            from ..utils.logger import Logger
-            if Logger.is_debug_mode():
-                cmd.append("--debug")
+            debug = Logger.is_debug_mode()
+            cmd = (*_BASE_CMD, webapp_id, "--debug") if debug else (*_BASE_CMD, webapp_id)
 
-            # Start subprocess (don't wait for it)
-            process = subprocess.Popen(
+            # posix_spawn avoids forking this (large) GTK/WebKit process;
+            # setsid detaches the webapp from our session
+            pid = os.posix_spawn(
+                sys.executable,
                 cmd,
-                start_new_session=True,  # Detach from parent process
-                stdout=subprocess.DEVNULL if not Logger.is_debug_mode() else None,
-                stderr=subprocess.DEVNULL if not Logger.is_debug_mode() else None,
+                os.environ,
+                file_actions=None if debug else _QUIET_SPAWN_ACTIONS,
+                setsid=True,
             )
+            # Reap the child when it exits (don't wait for it)
+            GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_webapp_exited)
 
-            logger.info(f"Webapp launched in separate process (PID: {process.pid})")
+            logger.info(f"Webapp launched in separate process (PID: {pid})")
 
         except Exception as e:
             logger.error(f"Failed to launch webapp in separate process: {e}", exc_info=True)
 
-    def _on_settings_clicked(self, button: Gtk.Button, webapp_id: str) -> None:
-        """Handle settings button clicked.
+    @staticmethod
+    def _on_webapp_exited(pid: int, status: int) -> None:
+        """Log the exit of a launched webapp process.
 
         Args:
-            button: Button widget
-            webapp_id: WebApp ID
+            pid: Process ID
+            status: Wait status reported by GLib
         """
-        logger.info(f"Settings clicked for webapp: {webapp_id}")
-        # Get webapp
-        webapp = self.webapp_manager.get_webapp(webapp_id)
-        if not webapp:
-            return
+        logger.debug(f"Webapp process {pid} exited (status {status})")
 
-        # Open edit dialog
-        from .add_dialog import AddWebAppDialog
+    def _show_settings(self, webapp: WebApp) -> None:
+        """Open the edit dialog for a webapp.
+
+        Args:
+            webapp: WebApp to edit
+        """
+        logger.info(f"Settings clicked for webapp: {webapp.id}")
 
-        dialog = AddWebAppDialog(
+        # Open edit dialog
+        dialog = _add_dialog_cls()(
             self, self.webapp_manager, webapp=webapp, on_saved=self._load_webapps
         )
         dialog.present(self)
 
-    def _on_delete_clicked(self, button: Gtk.Button, webapp_id: str) -> None:
-        """Handle delete button clicked.
+    def _show_delete_confirm(self, webapp: WebApp) -> None:
+        """Ask for confirmation before deleting a webapp.
 
         Args:
-            button: Button widget
-            webapp_id: WebApp ID
+            webapp: WebApp to delete
         """
+        webapp_id = webapp.id
         logger.info(f"Delete clicked for webapp: {webapp_id}")
 
-        # Get webapp
-        webapp = self.webapp_manager.get_webapp(webapp_id)
-        if not webapp:
-            return
-
         # Show confirmation dialog
         dialog = Adw.AlertDialog()
         dialog.set_heading(f"Delete {webapp.name}?")
@@ -525,21 +862,31 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_default_response("cancel")
         dialog.set_close_response("cancel")
 
-        # Handle response
-        def on_response(dialog, response):
-            if response == "delete":
-                try:
-                    self.webapp_manager.delete_webapp(webapp_id)
-                    self.close_webapp(webapp_id)
-                    logger.info(f"WebApp deleted: {webapp_id}")
-                    # Refresh list
-                    self._load_webapps()
-                except Exception as e:
-                    logger.error(f"Error deleting webapp: {e}", exc_info=True)
-
-        dialog.connect("response", on_response)
+        dialog.connect("response", self._on_delete_response, webapp_id)
         dialog.present(self)
 
+    def _on_delete_response(
+        self, dialog: Adw.AlertDialog, response: str, webapp_id: str
+    ) -> None:
+        """Delete the webapp if the confirmation dialog was accepted.
+
+        Args:
+            dialog: Confirmation dialog
+            response: Response ID
+            webapp_id: WebApp ID to delete
+        """
+        if response != "delete":
+            return
+
+        try:
+            self.webapp_manager.delete_webapp(webapp_id)
+            self.close_webapp(webapp_id)
+            logger.info(f"WebApp deleted: {webapp_id}")
+            # Refresh list
+            self._load_webapps()
+        except Exception as e:
+            logger.error(f"Error deleting webapp: {e}", exc_info=True)
+
 
     def close_webapp(self, webapp_id: str) -> bool:
         """Close webapp (webapps now run in separate processes)."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 import gi
 
@@ -26,6 +26,7 @@ class PreferencesDialog(Adw.PreferencesWindow):
 
         self._application = application
         self._language_codes: List[str] = []
+        self._languages_signature: Tuple[Tuple[str, str], ...] = ()
         self.set_transient_for(parent)
         self.set_modal(True)
         self.set_default_size(420, 260)
@@ -46,28 +47,38 @@ class PreferencesDialog(Adw.PreferencesWindow):
         self.general_group = general_group
 
         self.language_row = Adw.ComboRow()
-        self.language_row.connect("notify::selected", self._on_language_row_changed)
+        self._language_handler_id = self.language_row.connect(
+            "notify::selected", self._on_language_row_changed
+        )
         general_group.add(self.language_row)
 
         page.add(general_group)
         self.add(page)
 
     def _populate_languages(self) -> None:
-        """Populate language combo with available options."""
-        languages = available_languages()
-        codes = list(languages.keys())
-        labels = [languages[code] for code in codes]
-
-        selected_code = getattr(self._application.app_settings, "language", "pt")
-        selected_index = codes.index(selected_code) if selected_code in codes else 0
+        """Populate language combo with available options.
 
-        string_list = Gtk.StringList()
-        for label in labels:
-            string_list.append(label)
-
-        self._language_codes = codes
-        self.language_row.set_model(string_list)
-        self.language_row.set_selected(selected_index)
+        The model is only rebuilt when the set of languages or their labels
+        change; programmatic selection changes never reach
+        _on_language_row_changed.
+        """
+        languages = available_languages()
+        signature = tuple(languages.items())
+
+        self.language_row.handler_block(self._language_handler_id)
+        try:
+            if signature != self._languages_signature:
+                self._languages_signature = signature
+                self._language_codes = list(languages)
+                self.language_row.set_model(Gtk.StringList.new(list(languages.values())))
+
+            codes = self._language_codes
+            selected_code = getattr(self._application.app_settings, "language", "pt")
+            selected_index = codes.index(selected_code) if selected_code in codes else 0
+            if self.language_row.get_selected() != selected_index:
+                self.language_row.set_selected(selected_index)
+        finally:
+            self.language_row.handler_unblock(self._language_handler_id)
 
     def _apply_translations(self) -> None:
         """Update strings when language changes."""
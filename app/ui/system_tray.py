@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Callable, Optional
 
 import gi
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gio, GLib
+from gi.repository import Gio, GLib, GObject
 
 from ..utils.logger import get_logger
 
@@ -15,9 +16,74 @@ logger = get_logger(__name__)
 
 SNI_INTERFACE = "org.kde.StatusNotifierItem"
 SNI_PATH = "/StatusNotifierItem"
+WATCHER_BUS_NAME = "org.kde.StatusNotifierWatcher"
+WATCHER_PATH = "/StatusNotifierWatcher"
+# Milliseconds to wait for the watcher before giving up on registration
+WATCHER_TIMEOUT_MS = 2000
 DBUS_MENU_INTERFACE = "com.canonical.dbusmenu"
 MENU_OBJECT_PATH = "/MenuBar"
 
+# Returned for properties the item does not expose
+_EMPTY_PROPERTY = GLib.Variant("s", "")
+
+_SNI_XML = """
+<node>
+  <interface name="org.kde.StatusNotifierItem">
+    <property name="Category" type="s" access="read"/>
+    <property name="Id" type="s" access="read"/>
+    <property name="Title" type="s" access="read"/>
+    <property name="Status" type="s" access="read"/>
+    <property name="IconName" type="s" access="read"/>
+    <property name="Menu" type="o" access="read"/>
+    <method name="Activate">
+      <arg name="x" type="i" direction="in"/>
+      <arg name="y" type="i" direction="in"/>
+    </method>
+    <method name="ContextMenu">
+      <arg name="x" type="i" direction="in"/>
+      <arg name="y" type="i" direction="in"/>
+    </method>
+  </interface>
+</node>
+"""
+
+_MENU_XML = """
+<node>
+  <interface name="com.canonical.dbusmenu">
+    <method name="GetLayout">
+      <arg name="parentId" type="i" direction="in"/>
+      <arg name="recursionDepth" type="i" direction="in"/>
+      <arg name="propertyNames" type="as" direction="in"/>
+      <arg name="revision" type="u" direction="out"/>
+      <arg name="layout" type="(ia{sv}av)" direction="out"/>
+    </method>
+    <method name="Event">
+      <arg name="id" type="i" direction="in"/>
+      <arg name="eventId" type="s" direction="in"/>
+      <arg name="data" type="v" direction="in"/>
+      <arg name="timestamp" type="u" direction="in"/>
+    </method>
+    <signal name="LayoutUpdated">
+      <arg name="revision" type="u"/>
+      <arg name="parent" type="i"/>
+    </signal>
+  </interface>
+</node>
+"""
+
+
+def _parse_interface(xml: str, name: str) -> Optional[Gio.DBusInterfaceInfo]:
+    try:
+        return Gio.DBusNodeInfo.new_for_xml(xml).lookup_interface(name)
+    except Exception as exc:
+        logger.warning("Falha ao analisar interface DBus %s: %s", name, exc)
+        return None
+
+
+# Parsed once per process; every indicator registers the same interfaces
+_SNI_INTERFACE_INFO = _parse_interface(_SNI_XML, SNI_INTERFACE)
+_MENU_INTERFACE_INFO = _parse_interface(_MENU_XML, DBUS_MENU_INTERFACE)
+
 
 class TrayIndicator:
     """Expose tray menu via StatusNotifierItem/DBusMenu."""
@@ -38,18 +104,54 @@ class TrayIndicator:
         quit_label: str,
     ) -> None:
         self._app_id = app_id
-        self._title = title
-        self._icon_name = icon_name or "applications-internet"
+        # Interned so repeated updates with the same text compare by identity
+        self._title = sys.intern(title)
+        self._icon_name = sys.intern(icon_name or "applications-internet")
         self._status = "Active"
         self._on_activate = on_activate
         self._on_quit = on_quit
         self._open_label = open_label
         self._quit_label = quit_label
         self._menu_revision = 1
+        # Property replies are built once and swapped only when a value changes
+        self._prop_variants: dict[str, GLib.Variant] = {
+            "Category": GLib.Variant("s", "ApplicationStatus"),
+            "Id": GLib.Variant("s", self._app_id),
+            "Title": GLib.Variant("s", self._title),
+            "Status": GLib.Variant("s", self._status),
+            "IconName": GLib.Variant("s", self._icon_name),
+            "Menu": GLib.Variant("o", MENU_OBJECT_PATH),
+        }
+        # DBus method name -> handler(parameters, invocation)
+        self._method_dispatch: dict[
+            str, Callable[[GLib.Variant, Gio.DBusMethodInvocation], None]
+        ] = {
+            "Activate": self._on_activate_call,
+            "ContextMenu": self._on_context_menu_call,
+        }
+        self._menu_dispatch: dict[
+            str, Callable[[GLib.Variant, Gio.DBusMethodInvocation], None]
+        ] = {
+            "GetLayout": self._on_get_layout_call,
+            "Event": self._on_event_call,
+        }
+        # Menu item id -> idle callback run when the item is clicked
+        self._click_actions: dict[int, Callable[[], bool]] = {
+            self.OPEN_ITEM_ID: self._safe_activate,
+            self.QUIT_ITEM_ID: self._safe_quit,
+        }
+        # Changed properties waiting to go out in one PropertiesChanged signal
+        self._pending_properties: dict[str, GLib.Variant] = {}
+        self._properties_flush_id: Optional[int] = None
+        # Root (ia{sv}av) layout; rebuilt only after the labels change
+        self._cached_layout: Optional[
+            tuple[int, dict[str, GLib.Variant], list[GLib.Variant]]
+        ] = None
 
         self._connection: Optional[Gio.DBusConnection] = None
         self._registration_id: Optional[int] = None
         self._menu_registration_id: Optional[int] = None
+        self._watcher_cancellable: Optional[Gio.Cancellable] = None
         self._available = False
 
         try:
@@ -65,18 +167,24 @@ class TrayIndicator:
         return self._available
 
     def update_title(self, title: str) -> None:
-        if title == self._title:
+        title = sys.intern(title)
+        if title is self._title:
             return
         self._title = title
-        self._emit_property_changed("Title", GLib.Variant("s", self._title))
+        value = self._prop_variants["Title"] = GLib.Variant("s", title)
+        self._queue_property_changed("Title", value)
 
     def update_icon(self, icon_name: str) -> None:
-        if not icon_name:
-            icon_name = "applications-internet"
-        if icon_name == self._icon_name:
+        icon_name = sys.intern(icon_name or "applications-internet")
+        if icon_name is self._icon_name:
             return
         self._icon_name = icon_name
-        self._emit_property_changed("IconName", GLib.Variant("s", self._icon_name))
+        value = self._prop_variants["IconName"] = GLib.Variant("s", icon_name)
+        self._queue_property_changed("IconName", value)
+
+    def update_presentation(self, title: str, icon_name: str) -> None:
+        self.update_title(title)
+        self.update_icon(icon_name)
 
     def update_labels(self, open_label: str, quit_label: str) -> None:
         changed = False
@@ -88,9 +196,17 @@ class TrayIndicator:
             changed = True
         if changed:
             self._menu_revision += 1
+            self._cached_layout = None
             self._emit_layout_updated()
 
     def destroy(self) -> None:
+        if self._properties_flush_id is not None:
+            GLib.source_remove(self._properties_flush_id)
+            self._properties_flush_id = None
+        self._pending_properties.clear()
+        if self._watcher_cancellable is not None:
+            self._watcher_cancellable.cancel()
+            self._watcher_cancellable = None
         if not self._connection:
             return
         if self._registration_id:
@@ -115,24 +231,46 @@ class TrayIndicator:
     def _register_with_watcher(self) -> None:
         if not self._connection:
             return
+        # Asynchronous so a slow or missing watcher never stalls window startup
+        self._watcher_cancellable = Gio.Cancellable()
+        Gio.DBusProxy.new(
+            self._connection,
+            Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+            None,
+            WATCHER_BUS_NAME,
+            WATCHER_PATH,
+            WATCHER_BUS_NAME,
+            self._watcher_cancellable,
+            self._on_watcher_proxy_ready,
+            None,
+        )
+
+    def _on_watcher_proxy_ready(
+        self, _source: Optional[GObject.Object], result: Gio.AsyncResult, _user_data: object
+    ) -> None:
         try:
-            proxy = Gio.DBusProxy.new_sync(
-                self._connection,
-                Gio.DBusProxyFlags.NONE,
-                None,
-                "org.kde.StatusNotifierWatcher",
-                "/StatusNotifierWatcher",
-                "org.kde.StatusNotifierWatcher",
-                None,
-            )
-            bus_name = self._connection.get_unique_name()
-            proxy.call_sync(
-                "RegisterStatusNotifierItem",
-                GLib.Variant("(s)", (bus_name,)),
-                Gio.DBusCallFlags.NONE,
-                -1,
-                None,
-            )
+            proxy = Gio.DBusProxy.new_finish(result)
+        except Exception as exc:
+            logger.debug("StatusNotifierWatcher indisponível: %s", exc)
+            return
+        if not self._connection or self._watcher_cancellable is None:
+            return
+        proxy.call(
+            "RegisterStatusNotifierItem",
+            GLib.Variant("(s)", (self._connection.get_unique_name(),)),
+            Gio.DBusCallFlags.NONE,
+            WATCHER_TIMEOUT_MS,
+            self._watcher_cancellable,
+            self._on_watcher_registered,
+            None,
+        )
+
+    def _on_watcher_registered(
+        self, proxy: Gio.DBusProxy, result: Gio.AsyncResult, _user_data: object
+    ) -> None:
+        self._watcher_cancellable = None
+        try:
+            proxy.call_finish(result)
             logger.debug("Registrado no StatusNotifierWatcher")
         except Exception as exc:
             logger.debug("StatusNotifierWatcher indisponível: %s", exc)
@@ -140,28 +278,7 @@ class TrayIndicator:
     def _register_status_notifier(self) -> None:
         if not self._connection:
             return
-        introspection_xml = """
-        <node>
-          <interface name="org.kde.StatusNotifierItem">
-            <property name="Category" type="s" access="read"/>
-            <property name="Id" type="s" access="read"/>
-            <property name="Title" type="s" access="read"/>
-            <property name="Status" type="s" access="read"/>
-            <property name="IconName" type="s" access="read"/>
-            <property name="Menu" type="o" access="read"/>
-            <method name="Activate">
-              <arg name="x" type="i" direction="in"/>
-              <arg name="y" type="i" direction="in"/>
-            </method>
-            <method name="ContextMenu">
-              <arg name="x" type="i" direction="in"/>
-              <arg name="y" type="i" direction="in"/>
-            </method>
-          </interface>
-        </node>
-        """
-        node_info = Gio.DBusNodeInfo.new_for_xml(introspection_xml)
-        interface_info = node_info.lookup_interface(SNI_INTERFACE)
+        interface_info = _SNI_INTERFACE_INFO
         if not interface_info:
             raise RuntimeError("Não foi possível registrar interface StatusNotifierItem")
         self._registration_id = self._connection.register_object(
@@ -175,31 +292,7 @@ class TrayIndicator:
     def _register_menu(self) -> None:
         if not self._connection:
             return
-        introspection_xml = """
-        <node>
-          <interface name="com.canonical.dbusmenu">
-            <method name="GetLayout">
-              <arg name="parentId" type="i" direction="in"/>
-              <arg name="recursionDepth" type="i" direction="in"/>
-              <arg name="propertyNames" type="as" direction="in"/>
-              <arg name="revision" type="u" direction="out"/>
-              <arg name="layout" type="(ia{sv}av)" direction="out"/>
-            </method>
-            <method name="Event">
-              <arg name="id" type="i" direction="in"/>
-              <arg name="eventId" type="s" direction="in"/>
-              <arg name="data" type="v" direction="in"/>
-              <arg name="timestamp" type="u" direction="in"/>
-            </method>
-            <signal name="LayoutUpdated">
-              <arg name="revision" type="u"/>
-              <arg name="parent" type="i"/>
-            </signal>
-          </interface>
-        </node>
-        """
-        node_info = Gio.DBusNodeInfo.new_for_xml(introspection_xml)
-        interface_info = node_info.lookup_interface(DBUS_MENU_INTERFACE)
+        interface_info = _MENU_INTERFACE_INFO
         if not interface_info:
             raise RuntimeError("Não foi possível registrar interface DBusMenu")
         self._menu_registration_id = self._connection.register_object(
@@ -220,13 +313,13 @@ class TrayIndicator:
         _object_path: str,
         _interface_name: str,
         method_name: str,
-        _parameters: GLib.Variant,
+        parameters: GLib.Variant,
         invocation: Gio.DBusMethodInvocation,
     ) -> None:
-        if method_name == "Activate":
-            GLib.idle_add(self._safe_activate)
-            invocation.return_value(None)
-        elif method_name == "ContextMenu":
+        handler = self._method_dispatch.get(method_name)
+        if handler:
+            handler(parameters, invocation)
+        else:
             invocation.return_value(None)
 
     def _handle_get_property(
@@ -237,19 +330,7 @@ class TrayIndicator:
         _interface_name: str,
         property_name: str,
     ) -> GLib.Variant:
-        if property_name == "Category":
-            return GLib.Variant("s", "ApplicationStatus")
-        if property_name == "Id":
-            return GLib.Variant("s", self._app_id)
-        if property_name == "Title":
-            return GLib.Variant("s", self._title)
-        if property_name == "Status":
-            return GLib.Variant("s", self._status)
-        if property_name == "IconName":
-            return GLib.Variant("s", self._icon_name)
-        if property_name == "Menu":
-            return GLib.Variant("o", MENU_OBJECT_PATH)
-        return GLib.Variant("s", "")
+        return self._prop_variants.get(property_name, _EMPTY_PROPERTY)
 
     def _handle_menu_method_call(
         self,
@@ -261,28 +342,52 @@ class TrayIndicator:
         parameters: GLib.Variant,
         invocation: Gio.DBusMethodInvocation,
     ) -> None:
-        if method_name == "GetLayout":
-            layout = self._build_layout()
-            invocation.return_value(
-                GLib.Variant("(u(ia{sv}av))", (self._menu_revision, layout))
-            )
-            return
+        handler = self._menu_dispatch.get(method_name)
+        if handler:
+            handler(parameters, invocation)
+        else:
+            invocation.return_value(None)
 
-        if method_name == "Event":
-            item_id = parameters[0]
-            event_id = parameters[1]
+    def _on_activate_call(
+        self, _parameters: GLib.Variant, invocation: Gio.DBusMethodInvocation
+    ) -> None:
+        GLib.idle_add(self._safe_activate)
+        invocation.return_value(None)
 
-            if event_id == "clicked":
-                if item_id == self.OPEN_ITEM_ID:
-                    GLib.idle_add(self._safe_activate)
-                elif item_id == self.QUIT_ITEM_ID:
-                    GLib.idle_add(self._safe_quit)
-            invocation.return_value(None)
+    def _on_context_menu_call(
+        self, _parameters: GLib.Variant, invocation: Gio.DBusMethodInvocation
+    ) -> None:
+        invocation.return_value(None)
+
+    def _on_get_layout_call(
+        self, _parameters: GLib.Variant, invocation: Gio.DBusMethodInvocation
+    ) -> None:
+        layout = self._build_layout()
+        invocation.return_value(
+            GLib.Variant("(u(ia{sv}av))", (self._menu_revision, layout))
+        )
+
+    def _on_event_call(
+        self, parameters: GLib.Variant, invocation: Gio.DBusMethodInvocation
+    ) -> None:
+        item_id = parameters[0]
+        event_id = parameters[1]
+
+        if event_id == "clicked":
+            action = self._click_actions.get(item_id)
+            if action:
+                GLib.idle_add(action)
+        invocation.return_value(None)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
     def _build_layout(self) -> tuple[int, dict[str, GLib.Variant], list[GLib.Variant]]:
+        if self._cached_layout is None:
+            self._rebuild_layout_cache()
+        return self._cached_layout
+
+    def _rebuild_layout_cache(self) -> None:
         item_open = (
             self.OPEN_ITEM_ID,
             {
@@ -321,7 +426,7 @@ class TrayIndicator:
                 GLib.Variant("(ia{sv}av)", item_quit),
             ],
         )
-        return root_menu
+        self._cached_layout = root_menu
 
     def _safe_activate(self) -> bool:
         try:
@@ -337,7 +442,19 @@ class TrayIndicator:
             logger.debug("Falha ao sair via bandeja: %s", exc)
         return False
 
-    def _emit_property_changed(self, name: str, value: GLib.Variant) -> None:
+    def _queue_property_changed(self, name: str, value: GLib.Variant) -> None:
+        self._pending_properties[name] = value
+        if self._properties_flush_id is None:
+            self._properties_flush_id = GLib.idle_add(self._flush_properties_changed)
+
+    def _flush_properties_changed(self) -> bool:
+        self._properties_flush_id = None
+        changes, self._pending_properties = self._pending_properties, {}
+        if changes:
+            self._emit_properties_changed(changes)
+        return False
+
+    def _emit_properties_changed(self, changes: dict[str, GLib.Variant]) -> None:
         if not self._connection or not self._available:
             return
         try:
@@ -348,7 +465,7 @@ class TrayIndicator:
                 "PropertiesChanged",
                 GLib.Variant(
                     "(sa{sv}as)",
-                    (SNI_INTERFACE, {name: value}, []),
+                    (SNI_INTERFACE, changes, []),
                 ),
             )
         except Exception as exc:
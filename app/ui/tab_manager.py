@@ -11,7 +11,7 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("WebKit", "6.0")
-from gi.repository import Adw, Gtk, WebKit
+from gi.repository import Adw, GLib, Gtk, WebKit
 
 from ..data.models import WebApp, WebAppSettings
 from ..utils.i18n import gettext as _
@@ -24,6 +24,8 @@ logger = get_logger(__name__)
 
 # Constants for tab management
 MAX_TABS = 10
+# Window in which repeated document.title changes collapse into one update
+TITLE_DEBOUNCE_MS = 150
 
 
 class TabManager:
@@ -74,6 +76,10 @@ class TabManager:
 
         # Track WebViews by tab page
         self.webviews: Dict[Adw.TabPage, WebKit.WebView] = {}
+        # Reverse map so WebView signal handlers find their page directly
+        self._webview_to_page: Dict[WebKit.WebView, Adw.TabPage] = {}
+        # Pending title flush timeouts by WebView
+        self._pending_title_updates: Dict[WebKit.WebView, int] = {}
 
         # Connect tab view signals
         self.tab_view.connect("close-page", self._on_close_page_request)
@@ -133,6 +139,7 @@ class TabManager:
 
         # Store webview reference
         self.webviews[page] = webview
+        self._webview_to_page[webview] = page
 
         # Load URI
         load_uri = uri or self.webapp.url
@@ -168,8 +175,7 @@ class TabManager:
             self.create_new_tab()
 
         # Remove from tracking
-        if page in self.webviews:
-            del self.webviews[page]
+        self._forget_page(page)
 
         # Close the page
         self.tab_view.close_page(page)
@@ -191,6 +197,19 @@ class TabManager:
             return self.webviews.get(page)
         return None
 
+    def _forget_page(self, page: Adw.TabPage) -> None:
+        """Stop tracking a page and its WebView.
+
+        Args:
+            page: The TabPage being removed
+        """
+        webview = self.webviews.pop(page, None)
+        if webview is not None:
+            self._webview_to_page.pop(webview, None)
+            source_id = self._pending_title_updates.pop(webview, None)
+            if source_id is not None:
+                GLib.source_remove(source_id)
+
     def _update_tab_widths(self) -> None:
         """Update tab widths based on the number of open tabs.
 
@@ -231,24 +250,45 @@ class TabManager:
     ) -> None:
         """Handle WebView title changes.
 
+        Pages that rewrite document.title in quick bursts are collapsed
+        into a single update, applied after TITLE_DEBOUNCE_MS.
+
         Args:
             webview: The WebView whose title changed
             param: Parameter specification
         """
+        if webview in self._pending_title_updates:
+            return
+
+        self._pending_title_updates[webview] = GLib.timeout_add(
+            TITLE_DEBOUNCE_MS, self._flush_title, webview
+        )
+
+    def _flush_title(self, webview: WebKit.WebView) -> bool:
+        """Apply the latest title of a WebView to its tab.
+
+        Args:
+            webview: The WebView whose title changed
+
+        Returns:
+            False to remove the timeout
+        """
+        self._pending_title_updates.pop(webview, None)
+
         title = webview.get_title()
         if not title:
-            return
+            return False
 
-        # Find the page for this webview
-        for page, wv in self.webviews.items():
-            if wv == webview:
-                page.set_title(title)
-                logger.debug("Updated tab title: %s", title)
-                break
+        page = self._webview_to_page.get(webview)
+        if page is not None:
+            page.set_title(title)
+            logger.debug("Updated tab title: %s", title)
 
         # Call external callback if provided
         if self.on_title_changed_callback:
-            self.on_title_changed_callback(webview, param)
+            self.on_title_changed_callback(webview, None)
+
+        return False
 
     def _on_webview_uri_changed(
         self, webview: WebKit.WebView, param
@@ -271,14 +311,12 @@ class TabManager:
             webview: The WebView that changed
             load_event: Load event type
         """
-        # Find the page for this webview
-        for page, wv in self.webviews.items():
-            if wv == webview:
-                if load_event == WebKit.LoadEvent.STARTED:
-                    page.set_loading(True)
-                elif load_event == WebKit.LoadEvent.FINISHED:
-                    page.set_loading(False)
-                break
+        page = self._webview_to_page.get(webview)
+        if page is not None:
+            if load_event == WebKit.LoadEvent.STARTED:
+                page.set_loading(True)
+            elif load_event == WebKit.LoadEvent.FINISHED:
+                page.set_loading(False)
 
         # Call external callback if provided
         if self.on_load_changed_callback:
@@ -301,8 +339,7 @@ class TabManager:
             self.create_new_tab()
 
         # Remove from tracking
-        if page in self.webviews:
-            del self.webviews[page]
+        self._forget_page(page)
 
         # Update tab widths after close
         self._update_tab_widths()
@@ -343,4 +380,8 @@ class TabManager:
     def cleanup(self) -> None:
         """Clean up resources when TabManager is destroyed."""
         logger.info("Cleaning up TabManager")
+        for source_id in self._pending_title_updates.values():
+            GLib.source_remove(source_id)
+        self._pending_title_updates.clear()
         self.webviews.clear()
+        self._webview_to_page.clear()
@@ -305,8 +305,9 @@ class WebAppWindow(Adw.ApplicationWindow):
         """Refresh tray icon configuration."""
         self._ensure_tray_indicator()
         if self.tray_indicator and self.tray_indicator.available:
-            self.tray_indicator.update_title(self.webapp.name)
-            self.tray_indicator.update_icon(self._tray_icon_name())
+            self.tray_indicator.update_presentation(
+                self.webapp.name, self._tray_icon_name()
+            )
             self.tray_indicator.update_labels(_("tray.open"), _("tray.quit"))
 
     def _ensure_tray_indicator(self) -> None:
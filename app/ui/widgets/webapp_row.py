@@ -0,0 +1,120 @@
+"""Row widget for the webapp list.
+
+This module provides the templated row used by the main window's list view.
+The layout is described once in GtkBuilder XML, which GTK precompiles for the
+class, so creating a row does not chain a dozen Python widget constructors.
+"""
+
+from typing import Optional
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk
+
+_ROW_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <template class="SuperWebAppRow" parent="GtkBox">
+    <property name="orientation">horizontal</property>
+    <property name="spacing">12</property>
+    <property name="margin-start">12</property>
+    <property name="margin-end">12</property>
+    <property name="margin-top">8</property>
+    <property name="margin-bottom">8</property>
+    <property name="hexpand">true</property>
+    <style>
+      <class name="super-webapp-row"/>
+      <class name="card"/>
+    </style>
+    <child>
+      <object class="GtkImage" id="icon_widget">
+        <property name="pixel-size">48</property>
+        <property name="valign">center</property>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">6</property>
+        <property name="hexpand">true</property>
+        <child>
+          <object class="GtkLabel" id="name_label">
+            <property name="xalign">0</property>
+            <property name="ellipsize">end</property>
+            <style>
+              <class name="title-4"/>
+            </style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="url_label">
+            <property name="xalign">0</property>
+            <property name="ellipsize">end</property>
+            <property name="wrap">true</property>
+            <style>
+              <class name="dim-label"/>
+            </style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">horizontal</property>
+        <property name="spacing">6</property>
+        <property name="valign">center</property>
+        <style>
+          <class name="super-webapp-button-box"/>
+        </style>
+        <child>
+          <object class="GtkButton" id="launch_button">
+            <property name="action-name">row.launch</property>
+            <property name="icon-name">media-playback-start-symbolic</property>
+            <property name="valign">center</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="settings_button">
+            <property name="action-name">row.settings</property>
+            <property name="icon-name">emblem-system-symbolic</property>
+            <property name="valign">center</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="delete_button">
+            <property name="action-name">row.delete</property>
+            <property name="icon-name">user-trash-symbolic</property>
+            <property name="valign">center</property>
+            <style>
+              <class name="destructive-action"/>
+            </style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </template>
+</interface>
+"""
+
+
+@Gtk.Template(string=_ROW_UI)
+class WebAppRow(Gtk.Box):
+    """Recyclable list row showing a webapp's icon, name, URL and actions."""
+
+    __gtype_name__ = "SuperWebAppRow"
+
+    icon_widget: Gtk.Image = Gtk.Template.Child()
+    name_label: Gtk.Label = Gtk.Template.Child()
+    url_label: Gtk.Label = Gtk.Template.Child()
+    launch_button: Gtk.Button = Gtk.Template.Child()
+    settings_button: Gtk.Button = Gtk.Template.Child()
+    delete_button: Gtk.Button = Gtk.Template.Child()
+
+    def __init__(self) -> None:
+        """Instantiate the row from its template."""
+        super().__init__()
+
+        # Launch, settings, delete: the order callers pair tooltips with
+        self.buttons = (self.launch_button, self.settings_button, self.delete_button)
+        # (path, stamp) of an icon still being decoded for this row
+        self.icon_key: Optional[tuple[str, int]] = None
@@ -7,6 +7,7 @@ directory and provides helpers to translate UI labels at runtime.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, Optional
 
@@ -210,6 +211,7 @@ def _load_translations() -> None:
             logger.warning("Falha ao ler traduções personalizadas: %s", exc)
 
     _translations = data
+    _lookup.cache_clear()
 
 
 def available_languages() -> Dict[str, str]:
@@ -240,6 +242,7 @@ def set_language(language: str) -> str:
         return language
 
     _current_language = language
+    _lookup.cache_clear()
     for listener in list(_listeners):
         try:
             listener(language)
@@ -253,17 +256,24 @@ def get_language() -> str:
     return _current_language
 
 
-def gettext(key: str, *, language: Optional[str] = None, default: Optional[str] = None, **fmt) -> str:
-    """Get translated string for key."""
-    lang = language or _current_language
+@lru_cache(maxsize=512)
+def _lookup(lang: str, key: str, default: Optional[str]) -> str:
+    """Resolve a key in the loaded catalogs (memoized per language/key)."""
     fallback_lang = "pt"
-
-    value = (
-        _translations.get(lang, {}).get(
-            key, _translations.get(fallback_lang, {}).get(key, default or key)
-        )
+    return _translations.get(lang, {}).get(
+        key, _translations.get(fallback_lang, {}).get(key, default or key)
     )
 
+
+def clear_cache() -> None:
+    """Drop memoized lookups (done automatically on language/catalog changes)."""
+    _lookup.cache_clear()
+
+
+def gettext(key: str, *, language: Optional[str] = None, default: Optional[str] = None, **fmt) -> str:
+    """Get translated string for key."""
+    value = _lookup(language or _current_language, key, default)
+
     if fmt:
         try:
             value = value.format(**fmt)
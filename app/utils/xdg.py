@@ -4,6 +4,7 @@ This module provides helpers for working with XDG directories,
 following the freedesktop.org Base Directory specification.
 """
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -13,17 +14,19 @@ from typing import Optional
 APP_ID = "br.com.infinity.webapps"
 
 _ID_SANITIZE_PATTERN = re.compile(r"[^A-Za-z0-9_]")
+_APP_INSTANCE_SUFFIX_TMPL = "webapp_%s"
+_APP_INSTANCE_ID_TMPL = f"{APP_ID}.{_APP_INSTANCE_SUFFIX_TMPL}"
 
 
 def build_app_instance_suffix(webapp_id: str) -> str:
     """Return a D-Bus safe suffix for per-webapp identifiers."""
-    sanitized = _ID_SANITIZE_PATTERN.sub("_", webapp_id)
-    return f"webapp_{sanitized}"
+    return _APP_INSTANCE_SUFFIX_TMPL % _ID_SANITIZE_PATTERN.sub("_", webapp_id)
 
 
+@functools.cache
 def build_app_instance_id(webapp_id: str) -> str:
     """Return the full application ID used for standalone webapps."""
-    return f"{APP_ID}.{build_app_instance_suffix(webapp_id)}"
+    return _APP_INSTANCE_ID_TMPL % _ID_SANITIZE_PATTERN.sub("_", webapp_id)
 
 
 def build_desktop_filename(webapp_id: str) -> str:
@@ -44,17 +47,22 @@ class XDGDirectories:
     """
 
     @staticmethod
-    def get_config_dir() -> Path:
+    def _config_dir_path() -> Path:
+        """Resolve the XDG config directory without touching the filesystem."""
+        base = os.environ.get("XDG_CONFIG_HOME")
+        if not base:
+            base = str(Path.home() / ".config")
+
+        return Path(base) / APP_ID
+
+    @classmethod
+    def get_config_dir(cls) -> Path:
         """Get XDG config directory for the application.
 
         Returns:
             Path to config directory (creates if doesn't exist)
         """
-        base = os.environ.get("XDG_CONFIG_HOME")
-        if not base:
-            base = str(Path.home() / ".config")
-
-        config_dir = Path(base) / APP_ID
+        config_dir = cls._config_dir_path()
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir
 
@@ -119,13 +127,28 @@ class XDGDirectories:
         return cls.get_runtime_sessions_dir() / f"{webapp_id}.pid"
 
     @classmethod
+    @functools.cache
     def get_database_path(cls) -> Path:
         """Get path to SQLite database file.
 
+        The result is cached and does not create directories; call
+        ensure_dirs() during application startup.
+
         Returns:
             Path to database file
         """
-        return cls.get_config_dir() / "webapps.db"
+        return cls._config_dir_path() / "webapps.db"
+
+    @classmethod
+    def ensure_dirs(cls) -> None:
+        """Create the base config, data and cache directories.
+
+        Meant to be called once at application init so that cached path
+        lookups can skip their own directory probes.
+        """
+        cls.get_config_dir()
+        cls.get_data_dir()
+        cls.get_cache_dir()
 
     @classmethod
     def get_profiles_dir(cls) -> Path: